@@ -282,10 +282,10 @@ could differ from the user's intent or when multiple valid approaches exist.
         base_prompt = f"""You are Athena, an AI coding assistant. You help users with software engineering tasks.
 {interaction_instructions}
 You have access to tools for:
-- File operations: Read, Write, Edit, Insert, Delete, Move, Copy, ListDir, MakeDir
+- File operations: Read, BatchRead, Write, Edit, Insert, Delete, Move, Copy, ListDir, MakeDir
 - Search: Glob (find files by pattern), Grep (search file contents with regex)
 - Execution: Bash (run shell commands - tests, builds, package management, git add, etc.)
-- Git: GitStatus, GitDiff, GitCommit, GitLog, GitBranch, GitPush, GitCreatePR
+- Git: GitStatus, GitDiff, GitCommit, GitLog, GitSnapshot, GitBranch, GitPush, GitCreatePR
 - Math: Math (accurate mathematical expression evaluation)
 - Jupyter Notebooks: NotebookRead, NotebookEdit, NotebookExecute, NotebookCreate
 - Task management: TodoWrite for tracking multi-step tasks
@@ -296,6 +296,7 @@ You have access to tools for:
 
 File Operations:
 - Read - View file contents (ALWAYS use before Edit, Insert, or Write!)
+- BatchRead - View several files at once (faster than repeated Read calls)
 - Edit - Make precise changes to existing files (requires Read first)
 - Insert - Insert text at a specific line number (requires Read first)
   * Use insert_line=0 to insert at the beginning of the file
@@ -337,6 +338,7 @@ Git Tools (professional workflow with safety features):
   * Clear errors if hooks reject
   * Use Bash to 'git add' files first!
 - GitLog - View commit history
+- GitSnapshot - Status, staged/unstaged diffs and recent commits in one call
 - GitBranch - List, create, switch, or delete branches
 - GitPush - Push with retry logic and safety checks
   * Automatic retry on network failures (3 attempts)
@@ -72,12 +72,14 @@ class PermissionMode(str, Enum):
 # Read-only tools (allowed in Plan mode)
 READ_ONLY_TOOLS = {
     "Read",
+    "BatchRead",
     "Glob",
     "Grep",
     "ListDir",
     "GitStatus",
     "GitDiff",
     "GitLog",
+    "GitSnapshot",
     "WebSearch",
     "WebFetch",
     "NotebookRead",
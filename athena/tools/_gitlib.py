@@ -0,0 +1,227 @@
+"""In-process git access through libgit2, used when pygit2 is installed.
+
+Opening a repository loads its config and object database once; keeping
+the handle around lets repeated status queries skip the fork/exec and
+startup cost of the git CLI.
+"""
+
+import functools
+import importlib.util
+import os
+import threading
+from itertools import islice
+from typing import TYPE_CHECKING, Any, Optional
+
+if TYPE_CHECKING:
+    import pygit2
+
+# Only check that pygit2 is installed here; importing it costs tens of
+# milliseconds at startup, so that is deferred until a tool needs it
+PYGIT2_AVAILABLE = importlib.util.find_spec("pygit2") is not None
+
+
+@functools.cache
+def _pygit2():
+    """Import pygit2 on first use."""
+    import pygit2
+    import pygit2.enums
+
+    return pygit2
+
+
+# Open repositories keyed by their git directory. libgit2 handles are not
+# safe for concurrent use, so each one is paired with a lock.
+_repo_cache: dict[str, tuple["pygit2.Repository", threading.Lock]] = {}
+_repo_cache_lock = threading.Lock()
+
+
+@functools.cache
+def _worktree_codes() -> tuple[tuple[int, str], ...]:
+    """Worktree-side status flags mapped to the porcelain status letter."""
+    FileStatus = _pygit2().enums.FileStatus
+    return (
+        (FileStatus.WT_MODIFIED, "M"),
+        (FileStatus.WT_DELETED, "D"),
+        (FileStatus.WT_TYPECHANGE, "T"),
+    )
+
+
+def _open_repository(path: str) -> tuple["pygit2.Repository", threading.Lock]:
+    """Get a cached repository handle for a path inside a working tree."""
+    pygit2 = _pygit2()
+    git_dir = pygit2.discover_repository(os.path.realpath(path))
+    if git_dir is None:
+        raise ValueError(f"Not a git repository: {path}")
+
+    with _repo_cache_lock:
+        entry = _repo_cache.get(git_dir)
+        if entry is None:
+            entry = (pygit2.Repository(git_dir), threading.Lock())
+            _repo_cache[git_dir] = entry
+    return entry
+
+
+def _worktree_code(flags: int) -> str:
+    """Map status flags to the worktree porcelain letter (space if unchanged)."""
+    for flag, code in _worktree_codes():
+        if flags & flag:
+            return code
+    return " "
+
+
+def _index_version(repo: "pygit2.Repository") -> int:
+    """Read the index file format version (2 when there is no index yet)."""
+    try:
+        with open(os.path.join(repo.path, "index"), "rb") as f:
+            header = f.read(8)
+    except FileNotFoundError:
+        return 2
+    if len(header) < 8 or header[:4] != b"DIRC":
+        raise ValueError("Unrecognized index file")
+    return int.from_bytes(header[4:8], "big")
+
+
+def _index_changes(repo: "pygit2.Repository") -> dict[str, tuple[str, str]]:
+    """Get staged changes keyed by path, with renames detected.
+
+    Returns:
+        Dict mapping path to (status letter, display name)
+
+    Raises:
+        ValueError: If the index may hold intent-to-add entries
+    """
+    # pygit2 doesn't expose extended entry flags, so entries added with
+    # git add -N would look like staged additions. Only index v3+ can
+    # carry those flags; leave such repositories to the git CLI.
+    if _index_version(repo) > 2:
+        raise ValueError("Index has extended entry flags")
+
+    # The handle is long-lived, so pick up index changes made by other
+    # processes (git add, commits) first
+    repo.index.read(False)
+    if repo.head_is_unborn:
+        return {entry.path: ("A", entry.path) for entry in repo.index}
+
+    diff = repo.index.diff_to_tree(repo.head.peel(_pygit2().Tree))
+    diff.find_similar()
+    changes = {}
+    for delta in diff.deltas:
+        code = delta.status_char()
+        new_path = delta.new_file.path
+        if code in "RC":
+            changes[new_path] = (code, f"{delta.old_file.path} -> {new_path}")
+        else:
+            changes[new_path] = (code, new_path)
+    return changes
+
+
+def read_status(path: str, include_untracked: bool = True) -> dict[str, Any]:
+    """Read repository status without spawning git.
+
+    Returns the same structure as parsing ``git status --porcelain=v2``.
+
+    Args:
+        path: Path inside the working tree
+        include_untracked: Whether to scan for untracked files
+
+    Returns:
+        Dict with branch fields (head, oid, upstream, ahead, behind) and
+        lists of staged entries, modified, untracked and unmerged paths
+    """
+    FileStatus = _pygit2().enums.FileStatus
+    repo, lock = _open_repository(path)
+    with lock:
+        head: Optional[str]
+        oid: Optional[str] = None
+        upstream: Optional[str] = None
+        ahead: Optional[int] = None
+        behind: Optional[int] = None
+
+        if repo.head_is_unborn:
+            head = repo.references["HEAD"].target.removeprefix("refs/heads/")
+            oid = "(initial)"
+        elif repo.head_is_detached:
+            head = "(detached)"
+        else:
+            head = repo.head.shorthand
+            try:
+                # Raises KeyError when no upstream is configured
+                upstream_name = repo.branches.local[head].upstream_name
+            except KeyError:
+                upstream_name = None
+            if upstream_name:
+                upstream = upstream_name.removeprefix("refs/remotes/")
+                upstream_ref = repo.references.get(upstream_name)
+                if upstream_ref is not None:
+                    ahead, behind = repo.ahead_behind(repo.head.target, upstream_ref.target)
+
+        # Staged changes come from an index-to-HEAD diff so renames are
+        # detected; worktree changes come from the status flags
+        index_changes = _index_changes(repo)
+        worktree = repo.status(untracked_files="normal" if include_untracked else "no")
+
+        staged = []
+        modified = []
+        untracked = []
+        unmerged = []
+        for filename in sorted(index_changes.keys() | worktree.keys()):
+            flags = worktree.get(filename, 0)
+            if flags == FileStatus.WT_NEW:
+                untracked.append(filename)
+                continue
+            if flags & FileStatus.CONFLICTED:
+                unmerged.append(filename)
+                continue
+
+            index_code, display = index_changes.get(filename, (" ", filename))
+            status = index_code + _worktree_code(flags)
+            if status[0] in "AMDRC":
+                staged.append(f"{status} {display}")
+            if status[1] in "MD":
+                modified.append(filename)
+
+    return {
+        "head": head,
+        "oid": oid,
+        "upstream": upstream,
+        "ahead": ahead,
+        "behind": behind,
+        "staged": staged,
+        "modified": modified,
+        "untracked": untracked,
+        "unmerged": unmerged,
+    }
+
+
+def _subject(message: str) -> str:
+    """Get a commit's subject the way ``%s`` does: its first paragraph on one line."""
+    paragraph = message.lstrip("\n").split("\n\n", 1)[0]
+    return " ".join(line.strip() for line in paragraph.splitlines())
+
+
+def read_log(path: str, count: int) -> list[dict[str, Any]]:
+    """Read recent commits reachable from HEAD without spawning git.
+
+    Commits come in the same order as plain ``git log``.
+
+    Args:
+        path: Path inside the working tree
+        count: Maximum number of commits
+
+    Returns:
+        List of commits with sha, author, timestamp and subject
+    """
+    repo, lock = _open_repository(path)
+    with lock:
+        if repo.head_is_unborn:
+            return []
+        walker = repo.walk(repo.head.target)
+        return [
+            {
+                "sha": str(commit.id),
+                "author": commit.author.name,
+                "timestamp": commit.author.time,
+                "subject": _subject(commit.message),
+            }
+            for commit in islice(walker, max(count, 0))
+        ]
@@ -1,12 +1,134 @@
 """File operation tools."""
 
+import asyncio
+import mmap
 import os
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from pathlib import Path
 from typing import Any, Optional
 import aiofiles
 from athena.models.tool import Tool, ToolParameter, ToolParameterType, ToolResult
 
 
+# Dedicated pool for blocking file I/O. Threads here spend most of their
+# time blocked in syscalls, so it is sized for I/O concurrency rather than
+# CPU count and kept separate from the loop's default executor.
+_IO_EXECUTOR = ThreadPoolExecutor(max_workers=64, thread_name_prefix="athena-file-io")
+
+# Bound %-format for a single cat -n style line, taking (number, text).
+# Printf-style formatting avoids str.format's per-call field parsing.
+_NUMBERED_LINE = "%6d\t%s".__mod__
+
+
+def _format_numbered_lines(lines: list[str], start: int) -> str:
+    """Format lines with line numbers (cat -n style).
+
+    The per-line work is driven through ``map`` so that the strip and
+    format calls run in C rather than in a Python-level loop.
+
+    Args:
+        lines: Lines to format
+        start: Zero-based index of the first line in the file
+
+    Returns:
+        Numbered lines joined with newlines
+    """
+    numbers = range(start + 1, start + 1 + len(lines))
+    return "\n".join(map(_NUMBERED_LINE, zip(numbers, map(str.rstrip, lines))))
+
+
+def resolve_path(path: str) -> Path:
+    """Expand ~ and resolve a path to an absolute, symlink-free Path.
+
+    Equivalent to ``Path(path).expanduser().resolve()`` but done with the
+    C-level os.path helpers, building a single Path at the end.
+
+    Args:
+        path: User-supplied path
+
+    Returns:
+        Resolved path
+    """
+    return Path(os.path.realpath(os.path.expanduser(path)))
+
+
+# Files at least this large are read through mmap so that only the
+# requested window is copied out of the page cache and decoded.
+_MMAP_THRESHOLD = 64 * 1024
+
+
+def _read_lines(path: Path, start: int, limit: Optional[int]) -> list[str]:
+    """Read the requested window of lines from a file.
+
+    Lines outside the window are skipped without being kept, so only the
+    window the caller asked for is allocated. Line endings may or may not
+    be preserved depending on the read path; callers strip them anyway.
+
+    Args:
+        path: File to read
+        start: Zero-based index of the first line to return
+        limit: Maximum number of lines to return, or None for all
+
+    Returns:
+        Lines in the window
+    """
+    if os.path.getsize(path) >= _MMAP_THRESHOLD:
+        lines = _read_lines_mmap(path, start, limit)
+        if lines is not None:
+            return lines
+
+    stop = (start + limit) if limit else None
+    with open(path, "r", encoding="utf-8", errors="replace") as f:
+        return list(islice(f, start, stop))
+
+
+def _read_lines_mmap(path: Path, start: int, limit: Optional[int]) -> Optional[list[str]]:
+    """Read a window of lines from a large file via mmap.
+
+    Newlines are located on the mapped bytes and only the byte range
+    covering the window is decoded.
+
+    Returns:
+        Lines in the window, or None if the file contains carriage returns
+        and must go through universal-newline text mode instead
+    """
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        # Only \n is handled here; \r\n and lone \r would number lines
+        # differently from the text-mode path used for small files
+        if mm.find(b"\r") != -1:
+            return None
+
+        size = len(mm)
+        pos = 0
+        for _ in range(start):
+            nl = mm.find(b"\n", pos)
+            if nl == -1:
+                return []
+            pos = nl + 1
+        if pos >= size:
+            return []
+
+        end = size
+        if limit:
+            end = pos
+            for _ in range(limit):
+                nl = mm.find(b"\n", end)
+                if nl == -1:
+                    end = size
+                    break
+                end = nl + 1
+
+        # Window edges sit just after a newline byte, which is always a
+        # character boundary in UTF-8, so the slice decodes cleanly
+        text = mm[pos:end].decode("utf-8", errors="replace")
+
+    lines = text.split("\n")
+    if text.endswith("\n"):
+        lines.pop()
+    return lines
+
+
 class ReadTool(Tool):
     """Tool for reading files."""
 
@@ -50,7 +172,7 @@ class ReadTool(Tool):
     ) -> ToolResult:
         """Execute file read."""
         try:
-            path = Path(file_path).expanduser().resolve()
+            path = resolve_path(file_path)
 
             if not path.exists():
                 return ToolResult(
@@ -66,19 +188,13 @@ class ReadTool(Tool):
                     error=f"Path is not a file: {file_path}",
                 )
 
-            async with aiofiles.open(path, "r", encoding="utf-8", errors="replace") as f:
-                lines = await f.readlines()
-
-            # Apply offset and limit
+            # Apply offset and limit while reading
             start = (offset - 1) if offset else 0
-            end = (start + limit) if limit else len(lines)
-            lines = lines[start:end]
+            loop = asyncio.get_running_loop()
+            lines = await loop.run_in_executor(_IO_EXECUTOR, _read_lines, path, start, limit)
 
             # Format with line numbers (cat -n style)
-            numbered_lines = [
-                f"{i + start + 1:6d}\t{line.rstrip()}" for i, line in enumerate(lines)
-            ]
-            output = "\n".join(numbered_lines)
+            output = _format_numbered_lines(lines, start)
 
             return ToolResult(
                 success=True,
@@ -94,6 +210,97 @@ class ReadTool(Tool):
             )
 
 
+class BatchReadTool(Tool):
+    """Tool for reading several files in one call."""
+
+    def __init__(self):
+        """Initialize batch read tool."""
+        super().__init__()
+        self._reader = ReadTool()
+
+    @property
+    def name(self) -> str:
+        return "BatchRead"
+
+    @property
+    def description(self) -> str:
+        return (
+            "Reads multiple files from the filesystem concurrently. "
+            "Returns each file's content with line numbers, in the order given."
+        )
+
+    @property
+    def parameters(self) -> list[ToolParameter]:
+        return [
+            ToolParameter(
+                name="file_paths",
+                type=ToolParameterType.ARRAY,
+                description="Absolute paths of the files to read",
+                required=True,
+            ),
+        ]
+
+    async def execute(self, file_paths: list[str], **kwargs: Any) -> ToolResult:
+        """Execute batch file read."""
+        try:
+            # A bare string would otherwise be read one character at a time
+            if not isinstance(file_paths, list) or not all(
+                isinstance(p, str) for p in file_paths
+            ):
+                return ToolResult(
+                    success=False,
+                    output="",
+                    error="file_paths must be a list of file path strings",
+                )
+
+            if not file_paths:
+                return ToolResult(
+                    success=False,
+                    output="",
+                    error="No file paths provided",
+                )
+
+            # Each read runs in a worker thread, so the files are opened and
+            # read concurrently rather than one after another
+            results = await asyncio.gather(
+                *(self._reader.execute(file_path=p) for p in file_paths)
+            )
+
+            sections = []
+            failed = []
+            for file_path, result in zip(file_paths, results):
+                if result.success:
+                    sections.append(f"==> {file_path} <==\n{result.output}")
+                else:
+                    failed.append(file_path)
+                    sections.append(f"==> {file_path} <==\nError: {result.error}")
+
+            # Partial failures are reported inline; the call only fails
+            # when none of the files could be read
+            if len(failed) == len(file_paths):
+                return ToolResult(
+                    success=False,
+                    output="\n\n".join(sections),
+                    error=f"Failed to read all {len(failed)} file(s)",
+                )
+
+            return ToolResult(
+                success=True,
+                output="\n\n".join(sections),
+                metadata={
+                    "file_count": len(file_paths),
+                    "failed": failed,
+                },
+            )
+
+        except Exception as e:
+            return ToolResult(
+                success=False,
+                output="",
+                error=f"Failed to read files: {str(e)}",
+            )
+
+
 class WriteTool(Tool):
     """Tool for writing files."""
 
@@ -125,18 +332,21 @@ class WriteTool(Tool):
     async def execute(self, file_path: str, content: str, **kwargs: Any) -> ToolResult:
         """Execute file write."""
         try:
-            path = Path(file_path).expanduser().resolve()
+            path = resolve_path(file_path)
 
             # Create parent directories if needed
             path.parent.mkdir(parents=True, exist_ok=True)
 
-            async with aiofiles.open(path, "w", encoding="utf-8") as f:
-                await f.write(content)
+            # Encode once and write the bytes directly so the reported size
+            # comes from the same buffer instead of a second encode pass.
+            data = content.encode("utf-8")
+            async with aiofiles.open(path, "wb", executor=_IO_EXECUTOR) as f:
+                await f.write(data)
 
             return ToolResult(
                 success=True,
                 output=f"File written successfully: {file_path}",
-                metadata={"file_path": str(path), "bytes_written": len(content.encode())},
+                metadata={"file_path": str(path), "bytes_written": len(data)},
             )
 
         except Exception as e:
@@ -198,7 +408,7 @@ class EditTool(Tool):
     ) -> ToolResult:
         """Execute file edit."""
         try:
-            path = Path(file_path).expanduser().resolve()
+            path = resolve_path(file_path)
 
             if not path.exists():
                 return ToolResult(
@@ -207,33 +417,35 @@ class EditTool(Tool):
                     error=f"File not found: {file_path}",
                 )
 
-            async with aiofiles.open(path, "r", encoding="utf-8") as f:
+            async with aiofiles.open(path, "r", encoding="utf-8", executor=_IO_EXECUTOR) as f:
                 content = await f.read()
 
             # Check if old_string exists
-            if old_string not in content:
+            idx = content.find(old_string)
+            if idx == -1:
                 return ToolResult(
                     success=False,
                     output="",
                     error=f"String not found in file: {old_string[:100]}...",
                 )
 
-            # Check for multiple occurrences
-            count = content.count(old_string)
-            if count > 1 and not replace_all:
-                return ToolResult(
-                    success=False,
-                    output="",
-                    error=f"String appears {count} times. Use replace_all=true or provide more context.",
-                )
-
-            # Perform replacement
-            if replace_all:
-                new_content = content.replace(old_string, new_string)
+            # Look for a second occurrence before counting them all, so the
+            # common unique-match case costs a single scan of the file
+            end = idx + len(old_string)
+            if content.find(old_string, end) == -1:
+                count = 1
+                new_content = content[:idx] + new_string + content[end:]
             else:
-                new_content = content.replace(old_string, new_string, 1)
+                count = content.count(old_string)
+                if not replace_all:
+                    return ToolResult(
+                        success=False,
+                        output="",
+                        error=f"String appears {count} times. Use replace_all=true or provide more context.",
+                    )
+                new_content = content.replace(old_string, new_string)
 
-            async with aiofiles.open(path, "w", encoding="utf-8") as f:
+            async with aiofiles.open(path, "w", encoding="utf-8", executor=_IO_EXECUTOR) as f:
                 await f.write(new_content)
 
             replacements = count if replace_all else 1
@@ -297,7 +509,7 @@ class InsertTool(Tool):
     ) -> ToolResult:
         """Execute text insertion at specified line."""
         try:
-            path = Path(file_path).expanduser().resolve()
+            path = resolve_path(file_path)
 
             if not path.exists():
                 return ToolResult(
@@ -307,7 +519,7 @@ class InsertTool(Tool):
                 )
 
             # Read file
-            async with aiofiles.open(path, "r", encoding="utf-8") as f:
+            async with aiofiles.open(path, "r", encoding="utf-8", executor=_IO_EXECUTOR) as f:
                 lines = await f.readlines()
 
             # Validate insert_line
@@ -331,7 +543,7 @@ class InsertTool(Tool):
                 lines.insert(insert_line, new_text)
 
             # Write back to file
-            async with aiofiles.open(path, "w", encoding="utf-8") as f:
+            async with aiofiles.open(path, "w", encoding="utf-8", executor=_IO_EXECUTOR) as f:
                 await f.writelines(lines)
 
             return ToolResult(
@@ -5,6 +5,11 @@ import shutil
 from pathlib import Path
 from typing import Any, Optional
 from athena.models.tool import Tool, ToolParameter, ToolParameterType, ToolResult
+from athena.tools.file_ops import resolve_path
+
+# Paths that must never be deleted. Computed once at import; the working
+# directory can change at runtime so it is checked separately per call.
+_CRITICAL_PATHS = frozenset({Path.home().resolve(), Path("/").resolve()})
 
 
 class DeleteFileTool(Tool):
@@ -50,7 +55,7 @@ Safer than 'rm' because it validates paths and prevents accidents."""
     ) -> ToolResult:
         """Execute file deletion."""
         try:
-            target = Path(path).expanduser().resolve()
+            target = resolve_path(path)
 
             if not target.exists():
                 return ToolResult(
@@ -60,8 +65,13 @@ Safer than 'rm' because it validates paths and prevents accidents."""
                 )
 
             # Safety check: don't delete critical paths
-            critical_paths = [Path.home(), Path("/"), Path.cwd()]
-            if target in critical_paths:
+            # (filesystem roots are matched via their anchor so drive roots
+            # like C:\\ are covered on Windows)
+            if (
+                target in _CRITICAL_PATHS
+                or target == Path(target.anchor)
+                or target == Path.cwd().resolve()
+            ):
                 return ToolResult(
                     success=False,
                     output="",
@@ -155,8 +165,8 @@ Safer than 'mv' because it validates paths and prevents overwrites."""
     ) -> ToolResult:
         """Execute file move."""
         try:
-            src = Path(source).expanduser().resolve()
-            dst = Path(destination).expanduser().resolve()
+            src = resolve_path(source)
+            dst = resolve_path(destination)
 
             if not src.exists():
                 return ToolResult(
@@ -235,8 +245,8 @@ Creates parent directories if needed."""
     ) -> ToolResult:
         """Execute file copy."""
         try:
-            src = Path(source).expanduser().resolve()
-            dst = Path(destination).expanduser().resolve()
+            src = resolve_path(source)
+            dst = resolve_path(destination)
 
             if not src.exists():
                 return ToolResult(
@@ -332,7 +342,7 @@ Better than 'ls' because output is structured and filterable."""
     ) -> ToolResult:
         """Execute directory listing."""
         try:
-            target = Path(path).expanduser().resolve()
+            target = resolve_path(path)
 
             if not target.exists():
                 return ToolResult(
@@ -352,22 +362,7 @@ Better than 'ls' because output is structured and filterable."""
 
             if recursive:
                 # Recursive listing
-                for root, dirs, files in os.walk(target):
-                    root_path = Path(root)
-                    rel_path = root_path.relative_to(target)
-
-                    # Filter hidden if needed
-                    if not show_hidden:
-                        dirs[:] = [d for d in dirs if not d.startswith(".")]
-                        files = [f for f in files if not f.startswith(".")]
-
-                    if str(rel_path) != ".":
-                        output_lines.append(f"\n{rel_path}/")
-
-                    for file in sorted(files):
-                        file_path = root_path / file
-                        size = file_path.stat().st_size
-                        output_lines.append(f"  {file} ({self._format_size(size)})")
+                self._list_recursive(target, None, show_hidden, output_lines)
 
             else:
                 # Single directory listing
@@ -397,6 +392,54 @@ Better than 'ls' because output is structured and filterable."""
                 error=f"Failed to list directory: {str(e)}",
             )
 
+    def _list_recursive(
+        self,
+        root: Path,
+        rel_path: Optional[str],
+        show_hidden: bool,
+        output_lines: list[str],
+    ) -> None:
+        """Append a recursive listing of root to output_lines.
+
+        Hidden entries are skipped inside the scandir loop itself, so no
+        filtered copies of the directory and file lists are built.
+        Directories are visited depth-first from an explicit stack, so deep
+        trees don't hit the recursion limit.
+        """
+        stack: list[tuple[str, Optional[str]]] = [(str(root), rel_path)]
+        while stack:
+            directory, rel = stack.pop()
+            dirs = []
+            files = []
+            try:
+                with os.scandir(directory) as it:
+                    for entry in it:
+                        if not show_hidden and entry.name[0] == ".":
+                            continue
+                        if entry.is_dir():
+                            dirs.append(entry)
+                        else:
+                            files.append(entry)
+            except OSError:
+                # Unreadable directories are skipped, matching os.walk
+                continue
+
+            if rel is not None:
+                output_lines.append(f"\n{rel}/")
+
+            files.sort(key=lambda e: e.name)
+            for entry in files:
+                size = entry.stat().st_size
+                output_lines.append(f"  {entry.name} ({self._format_size(size)})")
+
+            # Pushed in reverse so subdirectories are listed in scan order
+            for entry in reversed(dirs):
+                # Like os.walk, don't descend into symlinked directories
+                if entry.is_symlink():
+                    continue
+                child_rel = entry.name if rel is None else os.path.join(rel, entry.name)
+                stack.append((entry.path, child_rel))
+
     @staticmethod
     def _format_size(size: int) -> str:
         """Format file size in human-readable format."""
@@ -447,7 +490,7 @@ Safe operation - doesn't fail if directory exists."""
     ) -> ToolResult:
         """Execute directory creation."""
         try:
-            target = Path(path).expanduser().resolve()
+            target = resolve_path(path)
 
             if target.exists():
                 if target.is_dir():
@@ -1,14 +1,631 @@
 """Git version control tools."""
 
 import asyncio
+import codecs
+import fnmatch
+import os
+import random
+import re
+import shutil
+import stat
+import time
+import weakref
+from collections import OrderedDict
 from pathlib import Path
 from typing import Any, Optional
 from athena.models.tool import Tool, ToolParameter, ToolParameterType, ToolResult
+from athena.tools import _gitlib
+from athena.tools._gitlib import PYGIT2_AVAILABLE
+
+
+# Push failures caused by transient network problems (worth retrying)
+_RETRYABLE_PUSH_ERROR_RE = re.compile(
+    rb"connection reset|could not resolve host|failed to connect|network is unreachable"
+    rb"|temporary failure|timeout|connection timed out|operation timed out",
+    re.IGNORECASE,
+)
+
+# Push failures with a known cause, mapped to user-friendly messages
+_PUSH_ERROR_RE = re.compile(
+    rb"(?P<permission>permission denied)"
+    rb"|(?P<auth>authentication failed)"
+    rb"|(?P<rejected>remote rejected)"
+    rb"|(?P<non_ff>non-fast-forward)"
+    rb"|(?P<no_remote>no such remote)",
+    re.IGNORECASE,
+)
+_PUSH_ERROR_MESSAGES = {
+    "permission": "Permission denied. Check your SSH keys or access token.",
+    "auth": "Authentication failed. Check your credentials.",
+    "rejected": "Remote rejected the push. May need to pull first.",
+    "non_ff": "Push rejected (non-fast-forward). Pull changes first or use --force carefully.",
+    "no_remote": "Remote not found. Check remote name with 'git remote -v'.",
+}
+
+
+def _load_protected_branches() -> tuple[frozenset[str], tuple[str, ...]]:
+    """Get the branches that may not be force-pushed.
+
+    ATHENA_PROTECTED_BRANCHES (comma-separated) replaces the defaults;
+    entries containing glob characters are matched as patterns.
+
+    Returns:
+        Tuple of (exact branch names, glob patterns)
+    """
+    value = os.getenv("ATHENA_PROTECTED_BRANCHES")
+    if value is None:
+        return frozenset({"main", "master", "production", "trunk"}), ("release/*", "hotfix/*")
+
+    entries = [entry.strip() for entry in value.split(",") if entry.strip()]
+    globs = tuple(entry for entry in entries if any(c in entry for c in "*?["))
+    return frozenset(entries).difference(globs), globs
+
+
+_PROTECTED_BRANCHES, _PROTECTED_GLOBS = _load_protected_branches()
+
+
+def _is_protected_branch(branch: str) -> bool:
+    """Check whether a branch is protected from force pushes."""
+    return branch in _PROTECTED_BRANCHES or any(
+        fnmatch.fnmatchcase(branch, pattern) for pattern in _PROTECTED_GLOBS
+    )
+
+
+# Global option for read-only commands: don't take index.lock to write back
+# refreshed stat info, which costs a lock file and fsync per call and can
+# collide with a concurrent git process in the same repository
+_NO_LOCKS = "--no-optional-locks"
+
+
+# Exception text longer than this is cut short in tool errors
+_ERROR_MAX_CHARS = 512
+
+
+def _error_message(prefix: str, error: BaseException) -> str:
+    """Format an exception for a tool error, truncating very long messages."""
+    text = str(error)
+    if len(text) > _ERROR_MAX_CHARS:
+        text = text[:_ERROR_MAX_CHARS] + "…"
+    return f"{prefix}: {text}"
+
+
+# Resolve git once instead of searching PATH on every spawn
+_GIT_BIN = shutil.which("git") or "git"
+
+# Upper bound on concurrently running git processes, so parallel tool calls
+# can't exhaust process or file descriptor limits
+_MAX_GIT_PROCESSES = min(32, (os.cpu_count() or 4) * 2)
+
+# asyncio primitives belong to one event loop, so keep one semaphore per loop
+_git_semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _git_slots() -> asyncio.Semaphore:
+    """Get the semaphore limiting concurrent git processes on the running loop."""
+    loop = asyncio.get_running_loop()
+    semaphore = _git_semaphores.get(loop)
+    if semaphore is None:
+        semaphore = asyncio.Semaphore(_MAX_GIT_PROCESSES)
+        _git_semaphores[loop] = semaphore
+    return semaphore
+
+
+async def _spawn_git(
+    path: str, *args: str, stdin: bool = False, env: Optional[dict[str, str]] = None
+) -> asyncio.subprocess.Process:
+    """Start a git subcommand with piped output.
+
+    All git processes in this module are created here so that process
+    setup is defined in one place. Callers must hold one of the
+    ``_git_slots()`` until the process has exited.
+
+    The repository is selected with ``git -C`` rather than ``cwd=`` and
+    descriptors are left to their (non-inheritable) defaults instead of
+    ``close_fds=True``; together with the absolute executable path this
+    lets subprocess use ``posix_spawn`` instead of fork/exec.
+
+    Args:
+        path: Repository path (used as the working directory)
+        *args: Arguments following ``git``
+        stdin: Whether to open a pipe for the process's stdin
+        env: Environment for the process (defaults to inheriting ours)
+
+    Returns:
+        The running process
+    """
+    return await asyncio.create_subprocess_exec(
+        _GIT_BIN,
+        "-C",
+        path,
+        *args,
+        stdin=asyncio.subprocess.PIPE if stdin else None,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+        close_fds=False,
+        env=env,
+    )
+
+
+async def _run_git(
+    path: str,
+    *args: str,
+    stdin: Optional[bytes] = None,
+    env: Optional[dict[str, str]] = None,
+) -> tuple[int, bytes, bytes]:
+    """Run a git subcommand in a repository and collect its output.
+
+    Args:
+        path: Repository path (used as the working directory)
+        *args: Arguments following ``git``
+        stdin: Optional bytes to feed to the process
+        env: Environment for the process (defaults to inheriting ours)
+
+    Returns:
+        Tuple of (returncode, stdout, stderr)
+    """
+    async with _git_slots():
+        process = await _spawn_git(path, *args, stdin=stdin is not None, env=env)
+        stdout, stderr = await process.communicate(stdin)
+    return process.returncode, stdout, stderr
+
+
+def _find_git_dir(path: str) -> Optional[Path]:
+    """Locate the git directory for a path without spawning git.
+
+    Walks up from path looking for ``.git``, following the ``gitdir:``
+    pointer used by worktrees and submodules.
+
+    Args:
+        path: Any path inside the working tree
+
+    Returns:
+        Path to the git directory, or None if not in a repository
+    """
+    current = Path(path).resolve()
+    for candidate in (current, *current.parents):
+        dot_git = candidate / ".git"
+        if dot_git.is_dir():
+            return dot_git
+        if dot_git.is_file():
+            content = dot_git.read_text().strip()
+            if content.startswith("gitdir:"):
+                return (candidate / content[len("gitdir:"):].strip()).resolve()
+    return None
+
+
+def _common_git_dir(git_dir: Path) -> Path:
+    """Get the directory holding shared refs and logs (differs for worktrees)."""
+    commondir = git_dir / "commondir"
+    if commondir.is_file():
+        return (git_dir / commondir.read_text().strip()).resolve()
+    return git_dir
+
+
+def _count_stashes(path: str) -> int:
+    """Count stash entries by reading the stash reflog directly."""
+    git_dir = _find_git_dir(path)
+    if git_dir is None:
+        return 0
+    try:
+        with open(_common_git_dir(git_dir) / "logs" / "refs" / "stash", "rb") as f:
+            return sum(1 for _ in f)
+    except OSError:
+        return 0
+
+
+def _read_branch_lines(path: str) -> Optional[list[str]]:
+    """List branches in the layout of ``git branch -a`` by reading ref files.
+
+    Reads loose refs under refs/heads and refs/remotes plus packed-refs.
+
+    Returns:
+        Output lines, or None if the listing has to come from ``git branch``
+        itself: HEAD is detached (git names the commit with its own
+        abbreviation length and reflog) or linked worktrees exist (git
+        marks their branches with "+")
+
+    Raises:
+        ValueError: If the refs can't be read from files, e.g. the
+            repository uses the reftable backend
+    """
+    git_dir = _find_git_dir(path)
+    if git_dir is None:
+        raise ValueError(f"Not a git repository: {path}")
+    common_dir = _common_git_dir(git_dir)
+    if (common_dir / "reftable").exists() or not (common_dir / "refs" / "heads").is_dir():
+        raise ValueError(f"Refs are not stored as files: {common_dir}")
+    try:
+        if any(os.scandir(common_dir / "worktrees")):
+            return None
+    except FileNotFoundError:
+        pass
+
+    head = (git_dir / "HEAD").read_bytes().strip()
+    if not head.startswith(b"ref:"):
+        return None
+    current = head[len(b"ref:"):].strip().decode(errors="replace")
+
+    # refname -> symref target (None for ordinary refs)
+    refs: dict[str, Optional[str]] = {}
+    try:
+        with open(common_dir / "packed-refs", "rb") as f:
+            for line in f:
+                if line[:1] in (b"#", b"^"):
+                    continue
+                _, _, name = line.rstrip(b"\n").partition(b" ")
+                if name.startswith((b"refs/heads/", b"refs/remotes/")):
+                    refs[name.decode(errors="replace")] = None
+    except FileNotFoundError:
+        pass
+
+    def walk(directory: str, prefix: str) -> None:
+        with os.scandir(directory) as it:
+            for entry in it:
+                name = prefix + entry.name
+                if entry.is_dir(follow_symlinks=False):
+                    walk(entry.path, name + "/")
+                elif not entry.name.endswith(".lock"):
+                    with open(entry.path, "rb") as f:
+                        content = f.read().strip()
+                    target = None
+                    if content.startswith(b"ref:"):
+                        target = content[len(b"ref:"):].strip().decode(errors="replace")
+                    refs[name] = target
+
+    walk(str(common_dir / "refs" / "heads"), "refs/heads/")
+    if (common_dir / "refs" / "remotes").is_dir():
+        walk(str(common_dir / "refs" / "remotes"), "refs/remotes/")
+
+    lines = []
+    remote_lines = []
+    for name in sorted(refs, key=lambda ref: ref.encode()):
+        if name.startswith("refs/heads/"):
+            marker = "* " if name == current else "  "
+            lines.append(f"{marker}{name[len('refs/heads/'):]}")
+        else:
+            line = f"  {name[len('refs/'):]}"
+            target = refs[name]
+            if target is not None:
+                line += f" -> {target.removeprefix('refs/remotes/').removeprefix('refs/heads/')}"
+            remote_lines.append(line)
+    return lines + remote_lines
+
+
+def _has_hooks(path: str) -> bool:
+    """Check whether commits in this repository may run a pre-commit hook.
+
+    Errs on the side of True: a configured core.hooksPath (e.g. husky)
+    counts as having hooks without inspecting the directory it names.
+    """
+    git_dir = _find_git_dir(path)
+    if git_dir is None:
+        return False
+    common_dir = _common_git_dir(git_dir)
+    if os.access(common_dir / "hooks" / "pre-commit", os.X_OK):
+        return True
+
+    worktree = git_dir.parent if git_dir.name == ".git" else Path(path)
+    if (worktree / ".pre-commit-config.yaml").exists():
+        return True
+
+    xdg_config = os.environ.get("XDG_CONFIG_HOME") or os.path.expanduser("~/.config")
+    for config in (
+        common_dir / "config",
+        Path(os.path.expanduser("~/.gitconfig")),
+        Path(xdg_config) / "git" / "config",
+    ):
+        try:
+            if b"hookspath" in config.read_bytes().lower():
+                return True
+        except OSError:
+            pass
+    return False
+
+
+# Cache of read-only git results that only change when refs move. Keys
+# include the ref file timestamps and a per-repository generation that
+# is bumped whenever a tool in this module moves a ref itself.
+_GIT_CACHE: dict[tuple, tuple[float, tuple[int, bytes, bytes]]] = {}
+_GIT_CACHE_TTL = 5.0
+_GIT_CACHE_MAX_ENTRIES = 256
+_git_cache_generation: dict[str, int] = {}
+
+
+# Files changed more recently than this (in nanoseconds) can't be trusted
+# in a stat-based cache key: a same-size rewrite within the filesystem's
+# timestamp granularity would leave their stat unchanged. This is git's
+# "racy clean" rule.
+_RACY_WINDOW_NS = 1_000_000_000
+
+
+def _ref_state(path: str) -> Optional[tuple[int, ...]]:
+    """Snapshot the timestamps of the files that HEAD resolution depends on.
+
+    Covers HEAD itself, packed-refs, and the loose ref of the checked-out
+    branch, so a commit, checkout or ref pack changes the snapshot.
+
+    Returns:
+        The snapshot, or None outside a repository or if any of the files
+        changed within the last second
+    """
+    git_dir = _find_git_dir(path)
+    if git_dir is None:
+        return None
+    common_dir = _common_git_dir(git_dir)
+    racy_after = time.time_ns() - _RACY_WINDOW_NS
+
+    def stamps(p: Path) -> Optional[tuple[int, int]]:
+        try:
+            st = p.stat()
+        except OSError:
+            return (0, 0)
+        if max(st.st_mtime_ns, st.st_ctime_ns) >= racy_after:
+            return None
+        return (st.st_mtime_ns, st.st_ctime_ns)
+
+    head = git_dir / "HEAD"
+    files = [head, common_dir / "packed-refs"]
+    try:
+        content = head.read_text().strip()
+    except OSError:
+        content = ""
+    if content.startswith("ref:"):
+        files.append(common_dir / content[len("ref:"):].strip())
+
+    state = []
+    for p in files:
+        file_stamps = stamps(p)
+        if file_stamps is None:
+            return None
+        state.extend(file_stamps)
+    return tuple(state)
+
+
+async def _cached_git(path: str, *args: str) -> tuple[int, bytes, bytes]:
+    """Run a read-only git command, reusing a recent result if refs are unchanged.
+
+    Args:
+        path: Repository path
+        *args: Arguments following ``git``
+
+    Returns:
+        Tuple of (returncode, stdout, stderr)
+    """
+    state = _ref_state(path)
+    if state is None:
+        return await _run_git(path, *args)
+
+    repo = os.path.realpath(path)
+    key = (repo, _git_cache_generation.get(repo, 0), state, args)
+    now = time.monotonic()
+    cached = _GIT_CACHE.get(key)
+    if cached is not None and now - cached[0] < _GIT_CACHE_TTL:
+        return cached[1]
+
+    result = await _run_git(path, *args)
+    if result[0] == 0:
+        if len(_GIT_CACHE) >= _GIT_CACHE_MAX_ENTRIES:
+            # Drop expired entries before growing further
+            for stale in [k for k, (t, _) in _GIT_CACHE.items() if now - t >= _GIT_CACHE_TTL]:
+                del _GIT_CACHE[stale]
+        _GIT_CACHE[key] = (now, result)
+    return result
+
+
+def _invalidate_git_cache(path: str) -> None:
+    """Forget cached git results and diffs for a repository after it was modified."""
+    repo = os.path.realpath(path)
+    _git_cache_generation[repo] = _git_cache_generation.get(repo, 0) + 1
+    for key in [k for k in _GIT_CACHE if k[0] == repo]:
+        del _GIT_CACHE[key]
+    for key in [k for k in _DIFF_CACHE if k[0] == repo]:
+        del _DIFF_CACHE[key]
+
+
+# Porcelain status letters (as byte values) that put an entry in each list
+_STAGED_CODES = frozenset(b"AMDRC")
+_MODIFIED_CODES = frozenset(b"MD")
+
+# Number of space-separated fields before the path, per v2 entry type:
+# ordinary (1), renamed/copied (2) and unmerged (u)
+_PORCELAIN_V2_FIELDS = {ord("1"): 8, ord("2"): 9, ord("u"): 10}
+
+
+def _parse_porcelain_v2(data: bytes) -> dict[str, Any]:
+    """Parse ``git status --porcelain=v2 --branch -z`` output in one pass.
+
+    Records are walked as raw bytes; status letters are compared as byte
+    values and only paths that end up in the result are decoded.
+
+    Args:
+        data: Raw stdout from git status
+
+    Returns:
+        Dict with branch fields (head, oid, upstream, ahead, behind) and
+        lists of staged entries, modified, untracked and unmerged paths
+    """
+    head = oid = upstream = None
+    ahead = behind = None
+    staged = []
+    modified = []
+    untracked = []
+    unmerged = []
+
+    records = data.split(b"\0")
+    i = 0
+    while i < len(records):
+        record = records[i]
+        i += 1
+        if not record:
+            continue
+
+        kind = record[0]
+        if kind == 0x23:  # "#" header: "# branch.<key> <value>"
+            key, _, value = record[2:].partition(b" ")
+            if key == b"branch.head":
+                head = value.decode(errors="replace")
+            elif key == b"branch.oid":
+                oid = value.decode()
+            elif key == b"branch.upstream":
+                upstream = value.decode(errors="replace")
+            elif key == b"branch.ab":
+                # "+<ahead> -<behind>"
+                a, b = value.split()
+                ahead, behind = int(a), -int(b)
+        elif kind == 0x3F:  # "?" untracked
+            untracked.append(record[2:].decode(errors="replace"))
+        elif kind == 0x75:  # "u" unmerged: reported on its own, not as staged/modified
+            unmerged.append(
+                record.split(b" ", _PORCELAIN_V2_FIELDS[kind])[-1].decode(errors="replace")
+            )
+        elif kind in _PORCELAIN_V2_FIELDS:
+            x, y = record[2], record[3]
+            in_staged = x in _STAGED_CODES
+            in_modified = y in _MODIFIED_CODES
+            if kind == 0x32:  # "2": original path follows as its own record
+                i += 1
+            if not (in_staged or in_modified):
+                continue
+
+            filename = record.split(b" ", _PORCELAIN_V2_FIELDS[kind])[-1].decode(
+                errors="replace"
+            )
+            if in_staged:
+                display = filename
+                if kind == 0x32:
+                    display = f"{records[i - 1].decode(errors='replace')} -> {filename}"
+                status = record[2:4].replace(b".", b" ").decode()
+                staged.append(f"{status} {display}")
+            if in_modified:
+                modified.append(filename)
+
+    return {
+        "head": head,
+        "oid": oid,
+        "upstream": upstream,
+        "ahead": ahead,
+        "behind": behind,
+        "staged": staged,
+        "modified": modified,
+        "untracked": untracked,
+        "unmerged": unmerged,
+    }
+
+
+def _format_branch(status: dict[str, Any]) -> Optional[str]:
+    """Render branch info as in 'git status --short --branch'."""
+    head = status["head"]
+    if not head:
+        return None
+
+    if head == "(detached)":
+        branch = "HEAD (no branch)"
+    elif status["oid"] == "(initial)":
+        branch = f"No commits yet on {head}"
+    else:
+        branch = head
+
+    if status["upstream"]:
+        branch += f"...{status['upstream']}"
+        if status["ahead"] is None:
+            branch += " [gone]"
+        else:
+            counts = []
+            if status["ahead"]:
+                counts.append(f"ahead {status['ahead']}")
+            if status["behind"]:
+                counts.append(f"behind {status['behind']}")
+            if counts:
+                branch += f" [{', '.join(counts)}]"
+    return branch
+
+
+async def _read_status(path: str, include_untracked: bool = True) -> tuple[dict[str, Any], int]:
+    """Read repository status and the stash count.
+
+    Args:
+        path: Repository path
+        include_untracked: Whether to scan for untracked files
+
+    Returns:
+        Tuple of (parsed status, stash count)
+
+    Raises:
+        RuntimeError: If git status fails
+    """
+    if PYGIT2_AVAILABLE:
+        # Read status in-process through libgit2 (no fork/exec). Anything
+        # libgit2 can't handle (unsupported extensions, odd worktree
+        # layouts) falls back to the git CLI, which reports real errors.
+        try:
+            return await asyncio.gather(
+                asyncio.to_thread(_gitlib.read_status, path, include_untracked),
+                asyncio.to_thread(_count_stashes, path),
+            )
+        except Exception:
+            pass
+
+    # Run git status with porcelain v2 format for parsing. -z gives
+    # NUL-terminated records with unquoted paths.
+    # The stash count is read from the reflog concurrently rather
+    # than spawning 'git stash list' afterwards
+    (returncode, stdout, stderr), stash_count = await asyncio.gather(
+        _run_git(
+            path,
+            _NO_LOCKS,
+            "status",
+            "--porcelain=v2",
+            "--branch",
+            "-z",
+            "--untracked-files=normal" if include_untracked else "--untracked-files=no",
+        ),
+        asyncio.to_thread(_count_stashes, path),
+    )
+    if returncode != 0:
+        raise RuntimeError(stderr.decode(errors="replace"))
+    return _parse_porcelain_v2(stdout), stash_count
+
+
+# In-flight status reads, so concurrent requests for the same repository
+# share one read instead of each starting their own
+_status_in_flight: dict[tuple[asyncio.AbstractEventLoop, str, bool], asyncio.Future] = {}
+
+
+async def _coalesced_status(
+    path: str, include_untracked: bool = True
+) -> tuple[dict[str, Any], int]:
+    """Read status, joining an identical read that is already running."""
+    key = (asyncio.get_running_loop(), os.path.realpath(path), include_untracked)
+    future = _status_in_flight.get(key)
+    if future is None:
+        future = asyncio.ensure_future(_read_status(path, include_untracked))
+        _status_in_flight[key] = future
+        future.add_done_callback(lambda _: _status_in_flight.pop(key, None))
+    # Shield so one caller being cancelled doesn't cancel the others' read
+    return await asyncio.shield(future)
 
 
 class GitStatusTool(Tool):
     """Tool for checking git status."""
 
+    _PARAMETERS = [
+        ToolParameter(
+            name="path",
+            type=ToolParameterType.STRING,
+            description="Path to git repository (defaults to current directory)",
+            required=False,
+        ),
+        ToolParameter(
+            name="include_untracked",
+            type=ToolParameterType.BOOLEAN,
+            description="List untracked files (set false to skip the slow untracked scan in very large repositories)",
+            required=False,
+            default=True,
+        ),
+    ]
+
     @property
     def name(self) -> str:
         return "GitStatus"
@@ -28,91 +645,57 @@ Better than plain 'git status' because it's parsed and formatted."""
 
     @property
     def parameters(self) -> list[ToolParameter]:
-        return [
-            ToolParameter(
-                name="path",
-                type=ToolParameterType.STRING,
-                description="Path to git repository (defaults to current directory)",
-                required=False,
-            ),
-        ]
-
-    async def execute(self, path: str = ".", **kwargs: Any) -> ToolResult:
+        return self._PARAMETERS
+
+    async def execute(
+        self, path: str = ".", include_untracked: bool = True, **kwargs: Any
+    ) -> ToolResult:
         """Execute git status."""
         try:
-            # Run git status with porcelain format for parsing
-            process = await asyncio.create_subprocess_exec(
-                "git",
-                "status",
-                "--porcelain",
-                "--branch",
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-                cwd=path,
-            )
-            stdout, stderr = await process.communicate()
-
-            if process.returncode != 0:
-                return ToolResult(
-                    success=False,
-                    output="",
-                    error=f"Git status failed: {stderr.decode()}",
-                )
-
-            # Parse status output
-            lines = stdout.decode().strip().split("\n")
-            branch_info = lines[0] if lines else ""
-            file_statuses = lines[1:] if len(lines) > 1 else []
+            status, stash_count = await _coalesced_status(path, include_untracked)
 
             # Format output
             output_lines = []
 
-            # Branch info
-            if branch_info.startswith("##"):
-                branch = branch_info[3:].strip()
+            branch = _format_branch(status)
+            if branch:
                 output_lines.append(f"Branch: {branch}")
 
+            if stash_count:
+                output_lines.append(f"Stashes: {stash_count}")
+
             # File statuses
-            if file_statuses:
-                staged = []
-                modified = []
-                untracked = []
-
-                for line in file_statuses:
-                    if not line.strip():
-                        continue
-
-                    status = line[:2]
-                    filename = line[3:]
-
-                    if status[0] in ["A", "M", "D", "R", "C"]:
-                        staged.append(f"{status} {filename}")
-                    if status[1] in ["M", "D"]:
-                        modified.append(filename)
-                    if status == "??":
-                        untracked.append(filename)
-
-                if staged:
-                    output_lines.append("\nStaged:")
-                    output_lines.extend(f"  {f}" for f in staged)
-
-                if modified:
-                    output_lines.append("\nModified:")
-                    output_lines.extend(f"  {f}" for f in modified)
-
-                if untracked:
-                    output_lines.append("\nUntracked:")
-                    output_lines.extend(f"  {f}" for f in untracked)
-            else:
+            staged = status["staged"]
+            modified = status["modified"]
+            untracked = status["untracked"]
+            unmerged = status["unmerged"]
+
+            sections = (
+                ("Staged", staged),
+                ("Modified", modified),
+                ("Untracked", untracked),
+                ("Unmerged (resolve conflicts)", unmerged),
+            )
+            for title, files in sections:
+                if files:
+                    # One entry per section instead of one per file keeps
+                    # the list short for large working trees
+                    output_lines.append(f"\n{title}:\n  " + "\n  ".join(files))
+
+            if not (staged or modified or untracked or unmerged):
                 output_lines.append("\nWorking tree clean")
 
             return ToolResult(
                 success=True,
                 output="\n".join(output_lines),
                 metadata={
-                    "staged_count": len([l for l in file_statuses if l[:2][0] in ["A", "M", "D", "R", "C"]]),
-                    "modified_count": len([l for l in file_statuses if l[:2][1] in ["M", "D"]]),
-                    "untracked_count": len([l for l in file_statuses if l[:2] == "??"]),
+                    "staged_count": len(staged),
+                    "modified_count": len(modified),
+                    "untracked_count": len(untracked),
+                    "unmerged_count": len(unmerged),
+                    "ahead": status["ahead"] or 0,
+                    "behind": status["behind"] or 0,
+                    "stash_count": stash_count,
                 },
             )
 
@@ -120,13 +703,134 @@ Better than plain 'git status' because it's parsed and formatted."""
             return ToolResult(
                 success=False,
                 output="",
-                error=f"Git status failed: {str(e)}",
+                error=_error_message("Git status failed", e),
             )
 
 
+# Diffs longer than this many characters are truncated in tool output
+_DIFF_MAX_CHARS = 10000
+
+# Recently shown diffs, least recently used first. Keys capture the file
+# stats the diff depends on (see _diff_cache_key); entries are dropped to
+# bound memory.
+_DIFF_CACHE: OrderedDict[tuple, str] = OrderedDict()
+_DIFF_CACHE_MAX_ENTRIES = 32
+
+
+def _diff_cache_key(path: str, file_path: Optional[str], staged: bool) -> Optional[tuple]:
+    """Build a cache key for a diff, or None if it can't be cached cheaply.
+
+    Staged diffs depend only on HEAD and the index. Unstaged diffs also
+    depend on the working tree, so they are only cached for a single
+    regular file, keyed on its stat. Files modified within the last second
+    are never cached.
+    """
+    git_dir = _find_git_dir(path)
+    if git_dir is None:
+        return None
+    racy_after = time.time_ns() - _RACY_WINDOW_NS
+
+    def stat_key(p: Path) -> Optional[tuple[int, int, int, int]]:
+        try:
+            st = p.stat()
+        except OSError:
+            return None
+        if not stat.S_ISREG(st.st_mode):
+            return None
+        if max(st.st_mtime_ns, st.st_ctime_ns) >= racy_after:
+            return None
+        return (st.st_mtime_ns, st.st_ctime_ns, st.st_size, st.st_ino)
+
+    worktree_state = None
+    if not staged:
+        if not file_path:
+            return None
+        worktree_state = stat_key(Path(path) / file_path)
+        if worktree_state is None:
+            return None
+
+    index_state = stat_key(git_dir / "index")
+    ref_state = _ref_state(path)
+    if index_state is None or ref_state is None:
+        return None
+
+    return (
+        os.path.realpath(path),
+        file_path or "",
+        staged,
+        ref_state,
+        index_state,
+        worktree_state,
+    )
+
+
+def _parse_numstat(data: bytes) -> list[dict[str, Any]]:
+    """Parse ``git diff --numstat -z`` output.
+
+    Returns:
+        List of changed files with path, insertions and deletions (both
+        None for binary files); renames are shown as "old -> new"
+    """
+    files = []
+    records = data.split(b"\0")
+    i = 0
+    while i < len(records):
+        record = records[i]
+        i += 1
+        if not record:
+            continue
+        added, deleted, name = record.split(b"\t", 2)
+        if name:
+            display = name.decode(errors="replace")
+        else:
+            # Renames leave the path empty; old and new paths follow
+            old, new = records[i], records[i + 1]
+            i += 2
+            display = f"{old.decode(errors='replace')} -> {new.decode(errors='replace')}"
+        binary = added == b"-"
+        files.append(
+            {
+                "path": display,
+                "insertions": None if binary else int(added),
+                "deletions": None if binary else int(deleted),
+            }
+        )
+    return files
+
+
 class GitDiffTool(Tool):
     """Tool for viewing git diffs."""
 
+    _PARAMETERS = [
+        ToolParameter(
+            name="file_path",
+            type=ToolParameterType.STRING,
+            description="Specific file to diff (optional, shows all if not provided)",
+            required=False,
+        ),
+        ToolParameter(
+            name="staged",
+            type=ToolParameterType.BOOLEAN,
+            description="Show staged changes instead of unstaged",
+            required=False,
+            default=False,
+        ),
+        ToolParameter(
+            name="mode",
+            type=ToolParameterType.STRING,
+            description="'full' for the patch, 'stat' for a per-file summary of lines added/removed",
+            required=False,
+            default="full",
+            enum=["full", "stat"],
+        ),
+        ToolParameter(
+            name="path",
+            type=ToolParameterType.STRING,
+            description="Path to git repository",
+            required=False,
+        ),
+    ]
+
     @property
     def name(self) -> str:
         return "GitDiff"
@@ -140,43 +844,43 @@ Shows what changed in files. Can show:
 - Staged changes (--staged)
 - Specific files
 - Specific commits
+- Just a per-file summary (mode='stat'), e.g. to pick files before viewing patches
 
 Better than 'git diff' because output is formatted and can be filtered."""
 
     @property
     def parameters(self) -> list[ToolParameter]:
-        return [
-            ToolParameter(
-                name="file_path",
-                type=ToolParameterType.STRING,
-                description="Specific file to diff (optional, shows all if not provided)",
-                required=False,
-            ),
-            ToolParameter(
-                name="staged",
-                type=ToolParameterType.BOOLEAN,
-                description="Show staged changes instead of unstaged",
-                required=False,
-                default=False,
-            ),
-            ToolParameter(
-                name="path",
-                type=ToolParameterType.STRING,
-                description="Path to git repository",
-                required=False,
-            ),
-        ]
+        return self._PARAMETERS
 
     async def execute(
         self,
         file_path: Optional[str] = None,
         staged: bool = False,
+        mode: str = "full",
         path: str = ".",
         **kwargs: Any,
     ) -> ToolResult:
         """Execute git diff."""
         try:
-            args = ["git", "diff"]
+            if mode == "stat":
+                return await self._diff_stat(file_path, staged, path)
+            if mode != "full":
+                return ToolResult(
+                    success=False,
+                    output="",
+                    error=f"Unknown mode: {mode}",
+                )
+
+            cache_key = _diff_cache_key(path, file_path, staged)
+            if cache_key is not None and cache_key in _DIFF_CACHE:
+                _DIFF_CACHE.move_to_end(cache_key)
+                return ToolResult(
+                    success=True,
+                    output=_DIFF_CACHE[cache_key],
+                    metadata={"staged": staged, "file": file_path},
+                )
+
+            args = [_NO_LOCKS, "diff"]
 
             if staged:
                 args.append("--staged")
@@ -184,32 +888,64 @@ Better than 'git diff' because output is formatted and can be filtered."""
             if file_path:
                 args.append(file_path)
 
-            process = await asyncio.create_subprocess_exec(
-                *args,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-                cwd=path,
-            )
-            stdout, stderr = await process.communicate()
-
-            if process.returncode != 0:
+            # Stream stdout and stop once the output cap is exceeded, rather
+            # than buffering the whole diff only to discard most of it.
+            # Chunks are decoded as they arrive so the cap counts characters.
+            async with _git_slots():
+                process = await _spawn_git(path, *args)
+                stderr_task = asyncio.ensure_future(process.stderr.read())
+                decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+                pieces = []
+                total = 0
+                truncated = False
+                try:
+                    while True:
+                        chunk = await process.stdout.read(8192)
+                        text = decoder.decode(chunk, final=not chunk)
+                        pieces.append(text)
+                        total += len(text)
+                        if total > _DIFF_MAX_CHARS:
+                            truncated = True
+                            break
+                        if not chunk:
+                            break
+                except BaseException:
+                    # Cancelled or failed mid-stream: don't leave git running
+                    # or its stderr reader pending
+                    stderr_task.cancel()
+                    try:
+                        process.kill()
+                    except ProcessLookupError:
+                        pass
+                    await process.wait()
+                    raise
+
+                if truncated:
+                    try:
+                        process.kill()
+                    except ProcessLookupError:
+                        pass
+                stderr = await stderr_task
+                await process.wait()
+
+            if process.returncode != 0 and not truncated:
                 return ToolResult(
                     success=False,
                     output="",
-                    error=f"Git diff failed: {stderr.decode()}",
+                    error=f"Git diff failed: {stderr.decode(errors='replace')}",
                 )
 
-            diff_output = stdout.decode()
+            diff_output = "".join(pieces)
 
-            if not diff_output:
-                return ToolResult(
-                    success=True,
-                    output="No changes" + (" staged" if staged else ""),
-                )
+            if truncated:
+                diff_output = diff_output[:_DIFF_MAX_CHARS] + "\n\n[Diff truncated - too long]"
+            elif not diff_output:
+                diff_output = "No changes" + (" staged" if staged else "")
 
-            # Truncate if too long
-            if len(diff_output) > 10000:
-                diff_output = diff_output[:10000] + "\n\n[Diff truncated - too long]"
+            if cache_key is not None:
+                _DIFF_CACHE[cache_key] = diff_output
+                if len(_DIFF_CACHE) > _DIFF_CACHE_MAX_ENTRIES:
+                    _DIFF_CACHE.popitem(last=False)
 
             return ToolResult(
                 success=True,
@@ -221,13 +957,71 @@ Better than 'git diff' because output is formatted and can be filtered."""
             return ToolResult(
                 success=False,
                 output="",
-                error=f"Git diff failed: {str(e)}",
+                error=_error_message("Git diff failed", e),
             )
 
+    async def _diff_stat(self, file_path: Optional[str], staged: bool, path: str) -> ToolResult:
+        """Summarize a diff as per-file line counts, without the patch."""
+        args = [_NO_LOCKS, "diff", "--numstat", "-z"]
+        if staged:
+            args.append("--staged")
+        if file_path:
+            args.extend(("--", file_path))
+
+        returncode, stdout, stderr = await _run_git(path, *args)
+        if returncode != 0:
+            return ToolResult(
+                success=False,
+                output="",
+                error=f"Git diff failed: {stderr.decode(errors='replace')}",
+            )
+
+        files = _parse_numstat(stdout)
+        if not files:
+            return ToolResult(
+                success=True,
+                output="No changes" + (" staged" if staged else ""),
+                metadata={"staged": staged, "file": file_path, "files": []},
+            )
+
+        output_lines = []
+        insertions = deletions = 0
+        for entry in files:
+            if entry["insertions"] is None:
+                output_lines.append(f"{entry['path']} | binary")
+            else:
+                insertions += entry["insertions"]
+                deletions += entry["deletions"]
+                output_lines.append(f"{entry['path']} | +{entry['insertions']} -{entry['deletions']}")
+        output_lines.append(
+            f"{len(files)} file(s) changed, {insertions} insertion(s)(+), {deletions} deletion(s)(-)"
+        )
+
+        return ToolResult(
+            success=True,
+            output="\n".join(output_lines),
+            metadata={"staged": staged, "file": file_path, "files": files},
+        )
+
 
 class GitCommitTool(Tool):
     """Tool for creating git commits with pre-commit hook handling."""
 
+    _PARAMETERS = [
+        ToolParameter(
+            name="message",
+            type=ToolParameterType.STRING,
+            description="Commit message",
+            required=True,
+        ),
+        ToolParameter(
+            name="path",
+            type=ToolParameterType.STRING,
+            description="Path to git repository",
+            required=False,
+        ),
+    ]
+
     @property
     def name(self) -> str:
         return "GitCommit"
@@ -247,20 +1041,7 @@ Features:
 
     @property
     def parameters(self) -> list[ToolParameter]:
-        return [
-            ToolParameter(
-                name="message",
-                type=ToolParameterType.STRING,
-                description="Commit message",
-                required=True,
-            ),
-            ToolParameter(
-                name="path",
-                type=ToolParameterType.STRING,
-                description="Path to git repository",
-                required=False,
-            ),
-        ]
+        return self._PARAMETERS
 
     async def execute(
         self, message: str, path: str = ".", **kwargs: Any
@@ -268,22 +1049,17 @@ Features:
         """Execute git commit with hook handling."""
         try:
             # Attempt commit
-            process = await asyncio.create_subprocess_exec(
-                "git",
-                "commit",
-                "-m",
-                message,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-                cwd=path,
-            )
-            stdout, stderr = await process.communicate()
-            output = stdout.decode() + stderr.decode()
+            returncode, stdout, stderr = await _run_git(path, "commit", "-m", message)
+            raw_output = stdout + stderr
+            output = raw_output.decode(errors="replace")
 
             # Commit failed
-            if process.returncode != 0:
+            if returncode != 0:
+                # git's messages are ASCII, so match on the raw bytes
+                lowered = raw_output.lower()
+
                 # Check for "nothing to commit"
-                if "nothing to commit" in output or "no changes added" in output:
+                if b"nothing to commit" in lowered or b"no changes added" in lowered:
                     return ToolResult(
                         success=False,
                         output=output,
@@ -291,7 +1067,7 @@ Features:
                     )
 
                 # Check for pre-commit hook rejection
-                if "pre-commit" in output.lower() or "hook" in output.lower():
+                if b"pre-commit" in lowered or b"hook" in lowered:
                     return ToolResult(
                         success=False,
                         output=output,
@@ -305,8 +1081,20 @@ Features:
                     error="Git commit failed",
                 )
 
-            # Commit succeeded - check if pre-commit hook modified files
-            modified_files = await self._get_modified_files(path)
+            _invalidate_git_cache(path)
+
+            # Without a pre-commit hook nothing can have changed files
+            if not _has_hooks(path):
+                return ToolResult(
+                    success=True,
+                    output=output,
+                    metadata={"message": message},
+                )
+
+            # Commit succeeded - one status call tells us both whether the
+            # pre-commit hook modified files and whether the commit is pushed
+            status = await self._get_post_commit_status(path)
+            modified_files = status["modified"] if status else []
 
             if modified_files:
                 # Hook auto-modified files (e.g., Black, Prettier)
@@ -320,7 +1108,7 @@ Features:
                     )
 
                 # Check if safe to amend
-                can_amend, amend_msg = await self._can_amend_safely(path)
+                can_amend, amend_msg = self._can_amend_safely(status)
                 if not can_amend:
                     return ToolResult(
                         success=True,
@@ -330,6 +1118,7 @@ Features:
 
                 # Safe to amend
                 amend_result = await self._amend_commit(path)
+                _invalidate_git_cache(path)
                 if amend_result.success:
                     return ToolResult(
                         success=True,
@@ -348,86 +1137,157 @@ Features:
             return ToolResult(
                 success=False,
                 output="",
-                error=f"Git commit failed: {str(e)}",
+                error=_error_message("Git commit failed", e),
             )
 
-    async def _get_modified_files(self, path: str) -> list[str]:
-        """Get list of modified files after commit."""
+    async def _get_post_commit_status(self, path: str) -> Optional[dict[str, Any]]:
+        """Get working tree and upstream status after commit."""
         try:
-            process = await asyncio.create_subprocess_exec(
-                "git", "diff", "--name-only",
-                stdout=asyncio.subprocess.PIPE,
-                cwd=path,
+            returncode, stdout, _ = await _run_git(
+                path,
+                _NO_LOCKS,
+                "status",
+                "--porcelain=v2",
+                "--branch",
+                "-z",
+                "--untracked-files=no",
             )
-            stdout, _ = await process.communicate()
-            files = stdout.decode().strip()
-            return files.split("\n") if files else []
+            if returncode != 0:
+                return None
+            return _parse_porcelain_v2(stdout)
         except:
-            return []
+            return None
 
     async def _stage_files(self, files: list[str], path: str) -> bool:
         """Stage modified files."""
         try:
-            process = await asyncio.create_subprocess_exec(
-                "git", "add", *files,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-                cwd=path,
+            # Pass paths on stdin so a large file list can't exceed ARG_MAX
+            returncode, _, _ = await _run_git(
+                path,
+                "add",
+                "--pathspec-from-file=-",
+                "--pathspec-file-nul",
+                stdin=b"\0".join(f.encode() for f in files),
             )
-            await process.communicate()
-            return process.returncode == 0
+            return returncode == 0
         except:
             return False
 
     async def _amend_commit(self, path: str) -> ToolResult:
         """Amend the last commit (no-edit)."""
         try:
-            process = await asyncio.create_subprocess_exec(
-                "git", "commit", "--amend", "--no-edit",
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-                cwd=path,
-            )
-            stdout, stderr = await process.communicate()
+            returncode, stdout, stderr = await _run_git(path, "commit", "--amend", "--no-edit")
 
             return ToolResult(
-                success=process.returncode == 0,
-                output=stdout.decode() + stderr.decode(),
+                success=returncode == 0,
+                output=(stdout + stderr).decode(errors="replace"),
             )
         except Exception as e:
-            return ToolResult(success=False, output="", error=str(e))
-
-    async def _can_amend_safely(self, path: str) -> tuple[bool, str]:
-        """Check if it's safe to amend the last commit."""
-        try:
-            # Check if commit has been pushed
-            process = await asyncio.create_subprocess_exec(
-                "git", "log", "@{u}..", "--oneline",
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-                cwd=path,
-            )
-            stdout, stderr = await process.communicate()
-
-            # If no upstream or error, it's safe (not pushed)
-            if process.returncode != 0:
-                return True, "Safe to amend (not pushed)"
-
-            # Check if there are unpushed commits
-            unpushed_commits = stdout.decode().strip().split("\n")
-            if len(unpushed_commits) > 0 and unpushed_commits[0]:
-                return True, "Safe to amend (commits not yet pushed)"
-
-            return False, "⚠️  Commit has been pushed to remote. Amending requires force push."
-
-        except:
-            # On error, be safe and allow amend
-            return True, "Unable to check push status - assuming safe"
+            return ToolResult(success=False, output="", error=_error_message("Amend failed", e))
+
+    def _can_amend_safely(self, status: dict[str, Any]) -> tuple[bool, str]:
+        """Check if it's safe to amend the last commit.
+
+        Args:
+            status: Parsed post-commit status, including ahead/behind counts
+        """
+        # No upstream (or it no longer exists), so nothing has been pushed
+        if status["ahead"] is None:
+            return True, "Safe to amend (not pushed)"
+
+        if status["ahead"] > 0:
+            return True, "Safe to amend (commits not yet pushed)"
+
+        return False, "⚠️  Commit has been pushed to remote. Amending requires force push."
+
+
+def _plural(count: int, unit: str) -> str:
+    return f"{count} {unit}" if count == 1 else f"{count} {unit}s"
+
+
+def _relative_time(timestamp: int, now: float) -> str:
+    """Format a commit time relative to now, matching git's ``%ar``."""
+    diff = int(now) - timestamp
+    if diff < 0:
+        return "in the future"
+    if diff < 90:
+        return f"{_plural(diff, 'second')} ago"
+    diff = (diff + 30) // 60
+    if diff < 90:
+        return f"{_plural(diff, 'minute')} ago"
+    diff = (diff + 30) // 60
+    if diff < 36:
+        return f"{_plural(diff, 'hour')} ago"
+    diff = (diff + 12) // 24
+    if diff < 14:
+        return f"{_plural(diff, 'day')} ago"
+    if diff < 70:
+        return f"{_plural((diff + 3) // 7, 'week')} ago"
+    if diff < 365:
+        return f"{_plural((diff + 15) // 30, 'month')} ago"
+    if diff < 1825:
+        total_months = (diff * 12 * 2 + 365) // (365 * 2)
+        years, months = divmod(total_months, 12)
+        if months:
+            return f"{_plural(years, 'year')}, {_plural(months, 'month')} ago"
+        return f"{_plural(years, 'year')} ago"
+    return f"{_plural((diff + 183) // 365, 'year')} ago"
+
+
+def _parse_log_records(data: bytes) -> list[dict[str, Any]]:
+    """Parse ``git log`` output written with unit/record separators.
+
+    Args:
+        data: Output of ``git log --format=%H%x1f%an%x1f%at%x1f%s%x1e``
+
+    Returns:
+        List of commits with sha, author, timestamp and subject
+    """
+    commits = []
+    for record in data.split(b"\x1e"):
+        # tformat puts a newline after each record's separator
+        record = record.lstrip(b"\n")
+        if not record:
+            continue
+        sha, author, timestamp, subject = record.split(b"\x1f", 3)
+        commits.append(
+            {
+                "sha": sha.decode(),
+                "author": author.decode(errors="replace"),
+                "timestamp": int(timestamp),
+                "subject": subject.decode(errors="replace"),
+            }
+        )
+    return commits
 
 
 class GitLogTool(Tool):
     """Tool for viewing git log."""
 
+    _LOG_ARGV = (_NO_LOCKS, "log", "--format=%H%x1f%an%x1f%at%x1f%s%x1e")
+
+    _PARAMETERS = [
+        ToolParameter(
+            name="count",
+            type=ToolParameterType.NUMBER,
+            description="Number of commits to show (default: 10)",
+            required=False,
+            default=10,
+        ),
+        ToolParameter(
+            name="file_path",
+            type=ToolParameterType.STRING,
+            description="Show log for specific file only",
+            required=False,
+        ),
+        ToolParameter(
+            name="path",
+            type=ToolParameterType.STRING,
+            description="Path to git repository",
+            required=False,
+        ),
+    ]
+
     @property
     def name(self) -> str:
         return "GitLog"
@@ -446,27 +1306,7 @@ Useful for understanding recent changes or finding commit messages to follow."""
 
     @property
     def parameters(self) -> list[ToolParameter]:
-        return [
-            ToolParameter(
-                name="count",
-                type=ToolParameterType.NUMBER,
-                description="Number of commits to show (default: 10)",
-                required=False,
-                default=10,
-            ),
-            ToolParameter(
-                name="file_path",
-                type=ToolParameterType.STRING,
-                description="Show log for specific file only",
-                required=False,
-            ),
-            ToolParameter(
-                name="path",
-                type=ToolParameterType.STRING,
-                description="Path to git repository",
-                required=False,
-            ),
-        ]
+        return self._PARAMETERS
 
     async def execute(
         self,
@@ -477,56 +1317,189 @@ Useful for understanding recent changes or finding commit messages to follow."""
     ) -> ToolResult:
         """Execute git log."""
         try:
-            args = [
-                "git",
-                "log",
-                f"-{count}",
-                "--pretty=format:%h - %an, %ar : %s",
-            ]
-
-            if file_path:
-                args.append(file_path)
-
-            process = await asyncio.create_subprocess_exec(
-                *args,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-                cwd=path,
-            )
-            stdout, stderr = await process.communicate()
-
-            if process.returncode != 0:
+            try:
+                count = int(count)
+            except (TypeError, ValueError):
                 return ToolResult(
                     success=False,
                     output="",
-                    error=f"Git log failed: {stderr.decode()}",
+                    error=f"Invalid commit count: {count!r}",
                 )
 
-            log_output = stdout.decode()
+            commits = None
+            if PYGIT2_AVAILABLE and not file_path:
+                # Walk history through the long-lived libgit2 handle instead of
+                # forking git; per-file history still goes through the CLI
+                try:
+                    commits = await asyncio.to_thread(_gitlib.read_log, path, count)
+                except Exception:
+                    commits = None
+
+            if commits is None:
+                args = [*self._LOG_ARGV, f"-{count}"]
+                if file_path:
+                    args.extend(("--", file_path))
+
+                returncode, stdout, stderr = await _cached_git(path, *args)
 
-            if not log_output:
+                if returncode != 0:
+                    return ToolResult(
+                        success=False,
+                        output="",
+                        error=f"Git log failed: {stderr.decode(errors='replace')}",
+                    )
+
+                commits = _parse_log_records(stdout)
+
+            if not commits:
                 return ToolResult(
                     success=True,
                     output="No commits found",
                 )
 
+            now = time.time()
+            for commit in commits:
+                commit["date"] = _relative_time(commit["timestamp"], now)
+            log_output = "\n".join(
+                f"{commit['sha'][:7]} - {commit['author']}, {commit['date']} : {commit['subject']}"
+                for commit in commits
+            )
+
             return ToolResult(
                 success=True,
                 output=log_output,
-                metadata={"count": count, "file": file_path},
+                metadata={"count": count, "file": file_path, "commits": commits},
             )
 
         except Exception as e:
             return ToolResult(
                 success=False,
                 output="",
-                error=f"Git log failed: {str(e)}",
+                error=_error_message("Git log failed", e),
             )
 
 
+class GitSnapshotTool(Tool):
+    """Tool for viewing status, diffs and recent history in one call."""
+
+    _PARAMETERS = [
+        ToolParameter(
+            name="log_count",
+            type=ToolParameterType.NUMBER,
+            description="Number of recent commits to include (default: 5)",
+            required=False,
+            default=5,
+        ),
+        ToolParameter(
+            name="path",
+            type=ToolParameterType.STRING,
+            description="Path to git repository",
+            required=False,
+        ),
+    ]
+
+    @property
+    def name(self) -> str:
+        return "GitSnapshot"
+
+    @property
+    def description(self) -> str:
+        return """Get a full picture of the repository in one call.
+
+Combines, run in parallel:
+- GitStatus (branch, staged/modified/untracked files)
+- GitDiff of staged changes
+- GitDiff of unstaged changes
+- GitLog of recent commits
+
+Faster than calling the four tools one after another, e.g. before committing."""
+
+    @property
+    def parameters(self) -> list[ToolParameter]:
+        return self._PARAMETERS
+
+    async def execute(self, log_count: int = 5, path: str = ".", **kwargs: Any) -> ToolResult:
+        """Execute status, diffs and log concurrently."""
+        sections = (
+            ("Status", GitStatusTool().execute(path=path)),
+            ("Staged changes", GitDiffTool().execute(staged=True, path=path)),
+            ("Unstaged changes", GitDiffTool().execute(path=path)),
+            ("Recent commits", GitLogTool().execute(count=log_count, path=path)),
+        )
+        results = await asyncio.gather(*(coro for _, coro in sections))
+
+        # Without a readable status there is nothing useful to show
+        if not results[0].success:
+            return results[0]
+
+        output_lines = []
+        for (title, _), result in zip(sections, results):
+            output_lines.append(f"=== {title} ===")
+            output_lines.append(result.output if result.success else f"Error: {result.error}")
+            output_lines.append("")
+
+        return ToolResult(
+            success=True,
+            output="\n".join(output_lines).rstrip(),
+            metadata={
+                "status": results[0].metadata,
+                "commits": results[3].metadata.get("commits", []),
+            },
+        )
+
+
+def _push_env() -> dict[str, str]:
+    """Build the environment for git push.
+
+    HTTP(S) transfers that stay under 1 KB/s for 30 seconds are aborted,
+    which sends them into the retry loop instead of waiting for the
+    kernel TCP timeout. SSH settings are left to the user's own config.
+    """
+    env = dict(os.environ)
+    env.setdefault("GIT_HTTP_LOW_SPEED_LIMIT", "1000")
+    env.setdefault("GIT_HTTP_LOW_SPEED_TIME", "30")
+    return env
+
+
 class GitPushTool(Tool):
     """Tool for pushing commits to remote with retry logic."""
 
+    _PARAMETERS = [
+        ToolParameter(
+            name="remote",
+            type=ToolParameterType.STRING,
+            description="Remote name (default: origin)",
+            required=False,
+            default="origin",
+        ),
+        ToolParameter(
+            name="branch",
+            type=ToolParameterType.STRING,
+            description="Branch name to push (defaults to current branch)",
+            required=False,
+        ),
+        ToolParameter(
+            name="set_upstream",
+            type=ToolParameterType.BOOLEAN,
+            description="Set upstream tracking (-u flag)",
+            required=False,
+            default=False,
+        ),
+        ToolParameter(
+            name="force",
+            type=ToolParameterType.BOOLEAN,
+            description="Force push (DANGEROUS - blocked for protected branches)",
+            required=False,
+            default=False,
+        ),
+        ToolParameter(
+            name="path",
+            type=ToolParameterType.STRING,
+            description="Path to git repository",
+            required=False,
+        ),
+    ]
+
     @property
     def name(self) -> str:
         return "GitPush"
@@ -536,50 +1509,16 @@ class GitPushTool(Tool):
         return """Push commits to remote repository with automatic retry on network failures.
 
 Features:
-- Exponential backoff retry (up to 3 attempts)
-- Safety check: prevents force push to main/master
+- Jittered exponential backoff retry (up to 3 attempts)
+- Safety check: prevents force push to protected branches (main, master, production, trunk, release/*, hotfix/*)
 - Helpful error messages for common issues
 - Upstream tracking setup with -u flag
 
-IMPORTANT: Only use force push when absolutely necessary and never on main/master."""
+IMPORTANT: Only use force push when absolutely necessary and never on protected branches."""
 
     @property
     def parameters(self) -> list[ToolParameter]:
-        return [
-            ToolParameter(
-                name="remote",
-                type=ToolParameterType.STRING,
-                description="Remote name (default: origin)",
-                required=False,
-                default="origin",
-            ),
-            ToolParameter(
-                name="branch",
-                type=ToolParameterType.STRING,
-                description="Branch name to push (defaults to current branch)",
-                required=False,
-            ),
-            ToolParameter(
-                name="set_upstream",
-                type=ToolParameterType.BOOLEAN,
-                description="Set upstream tracking (-u flag)",
-                required=False,
-                default=False,
-            ),
-            ToolParameter(
-                name="force",
-                type=ToolParameterType.BOOLEAN,
-                description="Force push (DANGEROUS - blocked for main/master)",
-                required=False,
-                default=False,
-            ),
-            ToolParameter(
-                name="path",
-                type=ToolParameterType.STRING,
-                description="Path to git repository",
-                required=False,
-            ),
-        ]
+        return self._PARAMETERS
 
     async def execute(
         self,
@@ -604,7 +1543,7 @@ IMPORTANT: Only use force push when absolutely necessary and never on main/maste
 
             # Safety check for force push
             if force:
-                if branch in ["main", "master"]:
+                if _is_protected_branch(branch):
                     return ToolResult(
                         success=False,
                         output="",
@@ -612,30 +1551,27 @@ IMPORTANT: Only use force push when absolutely necessary and never on main/maste
                     )
 
             # Build git push command
-            args = ["git", "push", remote, branch]
+            args = ["push", remote, branch]
 
             if set_upstream:
-                args.insert(2, "-u")  # Insert after "git push"
+                args.insert(1, "-u")  # Insert after "push"
 
             if force:
                 args.append("--force")
 
-            # Retry logic with exponential backoff
+            # Retry logic with jittered exponential backoff
+            env = _push_env()
             max_retries = 3
             for attempt in range(max_retries):
-                process = await asyncio.create_subprocess_exec(
-                    *args,
-                    stdout=asyncio.subprocess.PIPE,
-                    stderr=asyncio.subprocess.PIPE,
-                    cwd=path,
-                )
-                stdout, stderr = await process.communicate()
+                returncode, stdout, stderr = await _run_git(path, *args, env=env)
 
-                output = stdout.decode() + stderr.decode()
+                # Kept as bytes for matching; only decoded once we return
+                raw_output = stdout + stderr
 
                 # Success
-                if process.returncode == 0:
-                    success_msg = output.strip()
+                if returncode == 0:
+                    _invalidate_git_cache(path)
+                    success_msg = raw_output.decode(errors="replace").strip()
                     if attempt > 0:
                         success_msg += f"\n✓ Succeeded after {attempt + 1} attempts"
                     return ToolResult(
@@ -645,23 +1581,26 @@ IMPORTANT: Only use force push when absolutely necessary and never on main/maste
                     )
 
                 # Check if it's a retryable network error
-                if self._is_retryable_error(output):
+                if self._is_retryable_error(raw_output):
                     if attempt < max_retries - 1:
-                        wait_time = 2 ** attempt  # 1s, 2s, 4s
+                        # 1s, 2s, 4s (capped at 8s), scaled by 0.5-1.5x so
+                        # concurrent agents don't retry in lockstep
+                        wait_time = min(8, 2 ** attempt) * (0.5 + random.random())
                         await asyncio.sleep(wait_time)
                         continue  # Retry
 
                 # Non-retryable error - return immediately
+                output = raw_output.decode(errors="replace")
                 return ToolResult(
                     success=False,
                     output=output,
-                    error=f"Git push failed: {self._parse_error(output)}",
+                    error=f"Git push failed: {self._parse_error(raw_output) or output.strip()}",
                 )
 
             # Max retries exhausted
             return ToolResult(
                 success=False,
-                output=output,
+                output=raw_output.decode(errors="replace"),
                 error=f"Git push failed after {max_retries} retries. Check network connection.",
             )
 
@@ -669,62 +1608,69 @@ IMPORTANT: Only use force push when absolutely necessary and never on main/maste
             return ToolResult(
                 success=False,
                 output="",
-                error=f"Git push failed: {str(e)}",
+                error=_error_message("Git push failed", e),
             )
 
     async def _get_current_branch(self, path: str) -> Optional[str]:
         """Get the current git branch name."""
         try:
-            process = await asyncio.create_subprocess_exec(
-                "git", "branch", "--show-current",
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-                cwd=path,
-            )
-            stdout, _ = await process.communicate()
+            returncode, stdout, _ = await _cached_git(path, "branch", "--show-current")
 
-            if process.returncode == 0:
+            if returncode == 0:
                 return stdout.decode().strip()
             return None
         except:
             return None
 
-    def _is_retryable_error(self, error_msg: str) -> bool:
+    def _is_retryable_error(self, error_msg: bytes) -> bool:
         """Check if error should trigger retry."""
-        retryable_patterns = [
-            "connection reset",
-            "could not resolve host",
-            "failed to connect",
-            "network is unreachable",
-            "temporary failure",
-            "timeout",
-            "connection timed out",
-            "operation timed out",
-        ]
-        error_lower = error_msg.lower()
-        return any(pattern in error_lower for pattern in retryable_patterns)
-
-    def _parse_error(self, error_msg: str) -> str:
-        """Parse git push error and return user-friendly message."""
-        error_lower = error_msg.lower()
-
-        if "permission denied" in error_lower:
-            return "Permission denied. Check your SSH keys or access token."
-        elif "authentication failed" in error_lower:
-            return "Authentication failed. Check your credentials."
-        elif "remote rejected" in error_lower:
-            return "Remote rejected the push. May need to pull first."
-        elif "non-fast-forward" in error_lower:
-            return "Push rejected (non-fast-forward). Pull changes first or use --force carefully."
-        elif "no such remote" in error_lower:
-            return f"Remote not found. Check remote name with 'git remote -v'."
-
-        return error_msg.strip()
+        return _RETRYABLE_PUSH_ERROR_RE.search(error_msg) is not None
+
+    def _parse_error(self, error_msg: bytes) -> Optional[str]:
+        """Parse git push error and return user-friendly message, if it's a known one."""
+        match = _PUSH_ERROR_RE.search(error_msg)
+        if match:
+            return _PUSH_ERROR_MESSAGES[match.lastgroup]
+        return None
 
 
 class GitBranchTool(Tool):
     """Tool for git branch operations."""
 
+    # Formats reproducing `git branch -a`: current branch marker ("+" for
+    # branches checked out in other worktrees), then the name ("remotes/..."
+    # for remote refs) and any symref target
+    _LOCAL_FORMAT = (
+        "--format=%(if)%(HEAD)%(then)* %(else)%(if)%(worktreepath)%(then)+ %(else)  %(end)%(end)"
+        "%(refname:short)"
+    )
+    _REMOTE_FORMAT = (
+        "--format=  %(refname:lstrip=1)%(if)%(symref)%(then) -> %(symref:short)%(end)"
+    )
+
+    _PARAMETERS = [
+        ToolParameter(
+            name="action",
+            type=ToolParameterType.STRING,
+            description="Action to perform",
+            required=False,
+            default="list",
+            enum=["list", "create", "switch", "delete"],
+        ),
+        ToolParameter(
+            name="branch_name",
+            type=ToolParameterType.STRING,
+            description="Branch name (required for create/switch/delete)",
+            required=False,
+        ),
+        ToolParameter(
+            name="path",
+            type=ToolParameterType.STRING,
+            description="Path to git repository",
+            required=False,
+        ),
+    ]
+
     @property
     def name(self) -> str:
         return "GitBranch"
@@ -741,28 +1687,7 @@ Operations:
 
     @property
     def parameters(self) -> list[ToolParameter]:
-        return [
-            ToolParameter(
-                name="action",
-                type=ToolParameterType.STRING,
-                description="Action to perform",
-                required=False,
-                default="list",
-                enum=["list", "create", "switch", "delete"],
-            ),
-            ToolParameter(
-                name="branch_name",
-                type=ToolParameterType.STRING,
-                description="Branch name (required for create/switch/delete)",
-                required=False,
-            ),
-            ToolParameter(
-                name="path",
-                type=ToolParameterType.STRING,
-                description="Path to git repository",
-                required=False,
-            ),
-        ]
+        return self._PARAMETERS
 
     async def execute(
         self,
@@ -774,7 +1699,7 @@ Operations:
         """Execute git branch operation."""
         try:
             if action == "list":
-                args = ["git", "branch", "-a"]
+                return await self._list_branches(path)
             elif action == "create":
                 if not branch_name:
                     return ToolResult(
@@ -782,7 +1707,7 @@ Operations:
                         output="",
                         error="branch_name required for create action",
                     )
-                args = ["git", "branch", branch_name]
+                args = ["branch", branch_name]
             elif action == "switch":
                 if not branch_name:
                     return ToolResult(
@@ -790,7 +1715,7 @@ Operations:
                         output="",
                         error="branch_name required for switch action",
                     )
-                args = ["git", "checkout", branch_name]
+                args = ["checkout", branch_name]
             elif action == "delete":
                 if not branch_name:
                     return ToolResult(
@@ -798,7 +1723,7 @@ Operations:
                         output="",
                         error="branch_name required for delete action",
                     )
-                args = ["git", "branch", "-d", branch_name]
+                args = ["branch", "-d", branch_name]
             else:
                 return ToolResult(
                     success=False,
@@ -806,23 +1731,19 @@ Operations:
                     error=f"Unknown action: {action}",
                 )
 
-            process = await asyncio.create_subprocess_exec(
-                *args,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-                cwd=path,
-            )
-            stdout, stderr = await process.communicate()
+            returncode, stdout, stderr = await _run_git(path, *args)
 
-            output = stdout.decode() + stderr.decode()
+            output = (stdout + stderr).decode(errors="replace")
 
-            if process.returncode != 0:
+            if returncode != 0:
                 return ToolResult(
                     success=False,
                     output=output,
                     error=f"Git branch {action} failed",
                 )
 
+            _invalidate_git_cache(path)
+
             return ToolResult(
                 success=True,
                 output=output.strip(),
@@ -833,13 +1754,101 @@ Operations:
             return ToolResult(
                 success=False,
                 output="",
-                error=f"Git branch operation failed: {str(e)}",
+                error=_error_message("Git branch operation failed", e),
             )
 
+    async def _list_branches(self, path: str) -> ToolResult:
+        """List local and remote branches in the layout of ``git branch -a``.
+
+        Refs are read straight from the ref files when possible. With a
+        detached HEAD or linked worktrees, git branch -a prints the listing.
+        Otherwise local and remote refs are listed by two concurrent git
+        calls; local branches go through git branch, which also prints the
+        detached HEAD line.
+        """
+        try:
+            lines = await asyncio.to_thread(_read_branch_lines, path)
+        except (OSError, ValueError):
+            return await self._list_branches_concurrently(path)
+
+        if lines is None:
+            returncode, stdout, stderr = await _run_git(path, _NO_LOCKS, "branch", "-a")
+            if returncode != 0:
+                return ToolResult(
+                    success=False,
+                    output=stderr.decode(errors="replace"),
+                    error="Git branch list failed",
+                )
+            lines = stdout.decode(errors="replace").splitlines()
+
+        return ToolResult(
+            success=True,
+            output="\n".join(lines).strip(),
+            metadata={"action": "list", "branch": None},
+        )
+
+    async def _list_branches_concurrently(self, path: str) -> ToolResult:
+        """List local and remote branches with two concurrent git calls."""
+        (local_rc, local_out, local_err), (remote_rc, remote_out, remote_err) = (
+            await asyncio.gather(
+                _run_git(path, _NO_LOCKS, "branch", self._LOCAL_FORMAT),
+                _run_git(path, _NO_LOCKS, "for-each-ref", self._REMOTE_FORMAT, "refs/remotes"),
+            )
+        )
+
+        if local_rc != 0 or remote_rc != 0:
+            return ToolResult(
+                success=False,
+                output=(local_err + remote_err).decode(errors="replace"),
+                error="Git branch list failed",
+            )
+
+        output = (local_out + remote_out).decode(errors="replace")
+
+        return ToolResult(
+            success=True,
+            output=output.strip(),
+            metadata={"action": "list", "branch": None},
+        )
+
 
 class GitCreatePRTool(Tool):
     """Tool for creating GitHub Pull Requests using gh CLI."""
 
+    _PARAMETERS = [
+        ToolParameter(
+            name="title",
+            type=ToolParameterType.STRING,
+            description="Pull request title",
+            required=True,
+        ),
+        ToolParameter(
+            name="body",
+            type=ToolParameterType.STRING,
+            description="Pull request description/body",
+            required=False,
+        ),
+        ToolParameter(
+            name="base",
+            type=ToolParameterType.STRING,
+            description="Base branch (defaults to main/master)",
+            required=False,
+        ),
+        ToolParameter(
+            name="draft",
+            type=ToolParameterType.BOOLEAN,
+            description="Create as draft PR",
+            required=False,
+            default=False,
+        ),
+        ToolParameter(
+            name="path",
+            type=ToolParameterType.STRING,
+            description="Path to git repository",
+            required=False,
+        ),
+    ]
+
     @property
     def name(self) -> str:
         return "GitCreatePR"
@@ -860,39 +1869,7 @@ Features:
 
     @property
     def parameters(self) -> list[ToolParameter]:
-        return [
-            ToolParameter(
-                name="title",
-                type=ToolParameterType.STRING,
-                description="Pull request title",
-                required=True,
-            ),
-            ToolParameter(
-                name="body",
-                type=ToolParameterType.STRING,
-                description="Pull request description/body",
-                required=False,
-            ),
-            ToolParameter(
-                name="base",
-                type=ToolParameterType.STRING,
-                description="Base branch (defaults to main/master)",
-                required=False,
-            ),
-            ToolParameter(
-                name="draft",
-                type=ToolParameterType.BOOLEAN,
-                description="Create as draft PR",
-                required=False,
-                default=False,
-            ),
-            ToolParameter(
-                name="path",
-                type=ToolParameterType.STRING,
-                description="Path to git repository",
-                required=False,
-            ),
-        ]
+        return self._PARAMETERS
 
     async def execute(
         self,
@@ -918,38 +1895,40 @@ Features:
                 args.append("--draft")
 
             # Execute command
-            process = await asyncio.create_subprocess_exec(
-                *args,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-                cwd=path,
-            )
-            stdout, stderr = await process.communicate()
+            async with _git_slots():
+                process = await asyncio.create_subprocess_exec(
+                    *args,
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE,
+                    cwd=path,
+                )
+                stdout, stderr = await process.communicate()
 
             output = stdout.decode().strip()
-            error = stderr.decode().strip()
+            error = stderr.decode(errors="replace").strip()
 
             if process.returncode != 0:
-                # Parse common errors
-                if "gh: command not found" in error or "not found" in error.lower():
+                # Parse common errors (matched on the raw bytes)
+                lowered = stderr.lower()
+                if b"not found" in lowered:
                     return ToolResult(
                         success=False,
                         output="",
                         error="gh CLI not installed. Install with: brew install gh",
                     )
-                elif "not authenticated" in error.lower() or "authentication" in error.lower():
+                elif b"not authenticated" in lowered or b"authentication" in lowered:
                     return ToolResult(
                         success=False,
                         output="",
                         error="Not authenticated with GitHub. Run: gh auth login",
                     )
-                elif "no commits" in error.lower():
+                elif b"no commits" in lowered:
                     return ToolResult(
                         success=False,
                         output="",
                         error="No commits on current branch. Push commits first.",
                     )
-                elif "already exists" in error.lower():
+                elif b"already exists" in lowered:
                     return ToolResult(
                         success=False,
                         output="",
@@ -975,5 +1954,5 @@ Features:
             return ToolResult(
                 success=False,
                 output="",
-                error=f"PR creation failed: {str(e)}",
+                error=_error_message("PR creation failed", e),
             )
@@ -1,13 +1,47 @@
 """Git workflow utilities for professional commit messages and branch naming."""
 
+import re
 from typing import Optional, Tuple
 
 
+# File extensions used to classify changed files
+_DOC_EXTENSIONS = (".md", ".rst", ".txt")
+_CONFIG_EXTENSIONS = (".yaml", ".yml", ".json", ".toml", ".ini")
+_CODE_EXTENSIONS = (".py", ".js", ".ts", ".go")
+
+# Branch slug cleanup: spaces/underscores become dashes, punctuation is dropped
+_SLUG_TABLE = str.maketrans({" ": "-", "_": "-", **dict.fromkeys(".,!?:;()[]{}")})
+_DASH_RUN_RE = re.compile(r"-{2,}")
+
+# Keywords that select a branch prefix, highest priority first (hotfix wins
+# over bugfix, etc.). Keywords match anywhere in the description, so "fixes"
+# and "documentation" count too.
+_BRANCH_KEYWORDS = (
+    ("hotfix", ("critical", "urgent", "production", "hotfix", "security", "emergency")),
+    ("bugfix", ("fix", "bug", "broke", "error", "issue")),
+    ("docs", ("doc", "readme", "guide", "manual")),
+    ("test", ("test", "testing", "spec")),
+    ("refactor", ("refactor", "restructure", "reorganize")),
+    ("chore", ("chore", "config", "setup", "dependency", "dependencies", "package", "upgrade")),
+    ("release", ("release", "version")),
+)
+_KEYWORD_RANK = {
+    keyword: (rank, category)
+    for rank, (category, keywords) in enumerate(_BRANCH_KEYWORDS)
+    for keyword in keywords
+}
+# Zero-width lookahead so matches may overlap; at each position the
+# alternation tries higher-priority keywords first
+_BRANCH_KEYWORD_RE = re.compile(
+    "(?=(" + "|".join(re.escape(k) for _, keywords in _BRANCH_KEYWORDS for k in keywords) + "))"
+)
+
+
 class CommitMessageBuilder:
     """Build professional commit messages using conventional commit format."""
 
     # Valid commit types
-    VALID_TYPES = [
+    VALID_TYPES = frozenset({
         "feat",      # New feature
         "fix",       # Bug fix
         "docs",      # Documentation only changes
@@ -19,7 +53,7 @@ class CommitMessageBuilder:
         "ci",        # CI related changes
         "build",     # Build system changes
         "revert",    # Revert a previous commit
-    ]
+    })
 
     @staticmethod
     def build_conventional_commit(
@@ -53,26 +87,13 @@ class CommitMessageBuilder:
         if type not in CommitMessageBuilder.VALID_TYPES:
             type = "chore"  # Default to chore if invalid
 
-        # Build header: type(scope): description
-        header = type
-        if scope:
-            header += f"({scope})"
-        if breaking:
-            header += "!"
-        header += f": {description}"
-
-        # Build full message
-        parts = [header]
-
-        if body:
-            parts.append("")
-            parts.append(body)
-
-        if footer:
-            parts.append("")
-            parts.append(footer)
+        # Build header: type(scope)!: description
+        scope_part = f"({scope})" if scope else ""
+        bang = "!" if breaking else ""
+        header = f"{type}{scope_part}{bang}: {description}"
 
-        return "\n".join(parts)
+        # Body and footer each follow a blank line
+        return "\n\n".join(part for part in (header, body, footer) if part)
 
     @staticmethod
     def suggest_type_from_files(files: list[str]) -> str:
@@ -84,21 +105,30 @@ class CommitMessageBuilder:
         Returns:
             Suggested commit type
         """
-        # Analyze file patterns
-        has_tests = any("test" in f.lower() for f in files)
-        has_docs = any(f.lower().endswith((".md", ".rst", ".txt")) or "readme" in f.lower() for f in files)
-        has_config = any(f.lower().endswith((".yaml", ".yml", ".json", ".toml", ".ini")) or "config" in f.lower() for f in files)
-        has_ci = any(".github" in f or ".gitlab" in f or "ci" in f.lower() for f in files)
-        has_build = any("setup" in f.lower() or "package" in f.lower() or "requirements" in f.lower() for f in files)
+        # Analyze file patterns in a single pass
+        has_tests = has_docs = has_config = has_ci = has_build = False
+        has_non_test_code = False
+        only_docs = True
+        for f in files:
+            fl = f.lower()
+            is_test = "test" in fl
+            is_doc = fl.endswith(_DOC_EXTENSIONS)
+            has_tests = has_tests or is_test
+            has_docs = has_docs or is_doc or "readme" in fl
+            has_config = has_config or fl.endswith(_CONFIG_EXTENSIONS) or "config" in fl
+            has_ci = has_ci or ".github" in f or ".gitlab" in f or "ci" in fl
+            has_build = has_build or "setup" in fl or "package" in fl or "requirements" in fl
+            has_non_test_code = has_non_test_code or (f.endswith(_CODE_EXTENSIONS) and not is_test)
+            only_docs = only_docs and is_doc
 
         # Return most specific match
         if has_ci:
             return "ci"
         elif has_build:
             return "build"
-        elif has_tests and not any(f.endswith((".py", ".js", ".ts", ".go")) and "test" not in f.lower() for f in files):
+        elif has_tests and not has_non_test_code:
             return "test"  # Only test files
-        elif has_docs and len(files) == len([f for f in files if f.lower().endswith((".md", ".rst", ".txt"))]):
+        elif has_docs and only_docs:
             return "docs"  # Only docs
         elif has_config:
             return "chore"
@@ -212,47 +242,24 @@ class BranchNameValidator:
         Returns:
             Suggested branch name
         """
-        # Convert to lowercase
-        slug = description.lower()
-
-        # Replace spaces and special chars with dashes
-        slug = slug.replace(" ", "-")
-        slug = slug.replace("_", "-")
-        for char in [".", ",", "!", "?", ":", ";", "(", ")", "[", "]", "{", "}"]:
-            slug = slug.replace(char, "")
+        description_lower = description.lower()
 
-        # Remove consecutive dashes
-        while "--" in slug:
-            slug = slug.replace("--", "-")
+        # Turn spaces/underscores into dashes and drop punctuation
+        slug = description_lower.translate(_SLUG_TABLE)
 
-        # Trim dashes from ends
-        slug = slug.strip("-")
+        # Collapse runs of dashes and trim them from the ends
+        slug = _DASH_RUN_RE.sub("-", slug).strip("-")
 
         # Truncate if too long (leaving room for prefix)
         if len(slug) > 40:
             slug = slug[:40].rsplit("-", 1)[0]  # Cut at word boundary
 
-        # Detect type from keywords
-        description_lower = description.lower()
-
-        # Check for hotfix first (critical issues)
-        if any(word in description_lower for word in ["critical", "urgent", "production", "hotfix", "security", "emergency"]):
-            return f"hotfix/{slug}"
-        # Then regular bugfix
-        elif any(word in description_lower for word in ["fix", "bug", "broke", "error", "issue"]):
-            return f"bugfix/{slug}"
-        elif any(word in description_lower for word in ["doc", "readme", "guide", "manual"]):
-            return f"docs/{slug}"
-        elif any(word in description_lower for word in ["test", "testing", "spec"]):
-            return f"test/{slug}"
-        elif any(word in description_lower for word in ["refactor", "restructure", "reorganize"]):
-            return f"refactor/{slug}"
-        elif any(word in description_lower for word in ["chore", "config", "setup", "dependency", "dependencies", "package", "upgrade"]):
-            return f"chore/{slug}"
-        elif any(word in description_lower for word in ["release", "version"]):
-            return f"release/{slug}"
-        else:
-            return f"feature/{slug}"
+        # Detect type from keywords in one scan of the description
+        matches = _BRANCH_KEYWORD_RE.findall(description_lower)
+        if matches:
+            _, category = min(_KEYWORD_RANK[keyword] for keyword in matches)
+            return f"{category}/{slug}"
+        return f"feature/{slug}"
 
     @staticmethod
     def format(branch_name: str) -> str:
@@ -1,11 +1,444 @@
 """Mathematical expression evaluation tool."""
 
 import ast
+import functools
 import math
 import operator
-from typing import Any, Dict, Callable
+import re
+import string
+import types
+from typing import Any, Dict, Callable, Mapping
 from athena.models.tool import Tool, ToolParameter, ToolParameterType, ToolResult
 
+# Largest factorial argument and integer power result (in bits) allowed;
+# beyond these a single call can run for minutes and use gigabytes
+_MAX_FACTORIAL = 10_000
+_MAX_POWER_BITS = 10_000_000
+
+
+def _factorial(n: Any) -> int:
+    """``math.factorial`` with a bound on the argument."""
+    if isinstance(n, int) and n > _MAX_FACTORIAL:
+        raise ValueError(f"factorial argument too large (max {_MAX_FACTORIAL})")
+    return math.factorial(n)
+
+
+def _pow(base: Any, exp: Any, mod: Any = None) -> Any:
+    """``pow`` with a bound on the size of integer results."""
+    if (
+        mod is None
+        and isinstance(base, int)
+        and isinstance(exp, int)
+        and exp > 0
+        and abs(base) > 1
+        and base.bit_length() * exp > _MAX_POWER_BITS
+    ):
+        raise ValueError("exponent too large")
+    if mod is None:
+        return pow(base, exp)
+    return pow(base, exp, mod)
+
+
+# Define safe operations
+_SAFE_OPERATORS: Dict[type, Callable] = {
+    ast.Add: operator.add,
+    ast.Sub: operator.sub,
+    ast.Mult: operator.mul,
+    ast.Div: operator.truediv,
+    ast.FloorDiv: operator.floordiv,
+    ast.Mod: operator.mod,
+    ast.Pow: _pow,
+    ast.USub: operator.neg,
+    ast.UAdd: operator.pos,
+    # Comparisons
+    ast.Lt: operator.lt,
+    ast.LtE: operator.le,
+    ast.Gt: operator.gt,
+    ast.GtE: operator.ge,
+    ast.Eq: operator.eq,
+    ast.NotEq: operator.ne,
+}
+
+# Closure factories using the operator syntax directly, so the compiled
+# closure runs a BINARY_OP instruction instead of calling an operator function
+_BINOP_CLOSURES: Dict[type, Callable[[Callable, Callable], Callable[[], Any]]] = {
+    ast.Add: lambda left, right: lambda: left() + right(),
+    ast.Sub: lambda left, right: lambda: left() - right(),
+    ast.Mult: lambda left, right: lambda: left() * right(),
+    ast.Div: lambda left, right: lambda: left() / right(),
+    ast.FloorDiv: lambda left, right: lambda: left() // right(),
+    ast.Mod: lambda left, right: lambda: left() % right(),
+}
+
+# Define safe functions and constants (read-only, since compiled
+# expressions capture these values)
+_SAFE_NAMES: Mapping[str, Any] = types.MappingProxyType({
+    # Trigonometric functions
+    'sin': math.sin,
+    'cos': math.cos,
+    'tan': math.tan,
+    'asin': math.asin,
+    'acos': math.acos,
+    'atan': math.atan,
+    'atan2': math.atan2,
+    'sinh': math.sinh,
+    'cosh': math.cosh,
+    'tanh': math.tanh,
+
+    # Exponential and logarithmic
+    'exp': math.exp,
+    'log': math.log,
+    'log10': math.log10,
+    'log2': math.log2,
+    'sqrt': math.sqrt,
+
+    # Power and roots
+    'pow': _pow,
+
+    # Rounding
+    'abs': abs,
+    'round': round,
+    'ceil': math.ceil,
+    'floor': math.floor,
+    'trunc': math.trunc,
+
+    # Special functions
+    # Cached across expressions; typed so factorial(20.0) still fails
+    'factorial': functools.lru_cache(maxsize=256, typed=True)(_factorial),
+    'gcd': math.gcd,
+
+    # Conversion
+    'degrees': math.degrees,
+    'radians': math.radians,
+
+    # Constants
+    'pi': math.pi,
+    'e': math.e,
+    'tau': math.tau,
+    'inf': math.inf,
+    'nan': math.nan,
+
+    # Min/max
+    'min': min,
+    'max': max,
+
+    # Sum (for lists)
+    'sum': sum,
+})
+
+# Names that always refer to the same value and can be folded
+_CONSTANT_NAMES = frozenset({'pi', 'e', 'tau', 'inf', 'nan'})
+
+# Longest expression accepted; bounds the cost of parsing untrusted input
+_MAX_EXPRESSION_LENGTH = 4096
+
+# Plain decimal numbers, which can be converted without parsing
+_NUMERIC_RE = re.compile(r'-?(?:0|[1-9]\d*)(?:\.\d+)?')
+
+# Characters that can appear in a supported expression
+_ALLOWED_CHARS = frozenset(string.ascii_letters + string.digits + string.whitespace + '.+-*/%()[]<>=!,_\'"')
+
+
+@functools.lru_cache(maxsize=1024)
+def _compile(expression: str) -> Callable[[], Any]:
+    """Parse an expression and build a callable that evaluates it.
+
+    Constant subtrees are folded and compiled expressions are kept in a
+    bounded LRU cache, so repeated calculations skip parsing, validation
+    and evaluation.
+
+    Args:
+        expression: Math expression to compile
+
+    Returns:
+        Zero-argument callable returning the expression's value
+
+    Raises:
+        SyntaxError: If the expression cannot be parsed
+        ValueError: If unsafe operation attempted
+    """
+    if len(expression) > _MAX_EXPRESSION_LENGTH:
+        raise ValueError(f"Expression too long (max {_MAX_EXPRESSION_LENGTH} characters)")
+
+    # Skip the parser for plain numbers and for input that cannot be valid
+    if _NUMERIC_RE.fullmatch(expression):
+        value = float(expression) if '.' in expression else int(expression)
+        return lambda: value
+    for char in expression:
+        if char not in _ALLOWED_CHARS:
+            raise SyntaxError(f"unsupported character {char!r}")
+
+    return _build(_fold(ast.parse(expression, mode='eval').body))
+
+
+def _operands(node: ast.AST) -> list[ast.AST]:
+    """Get the child expressions of a node, in evaluation order."""
+    if isinstance(node, ast.BinOp):
+        return [node.left, node.right]
+    elif isinstance(node, ast.UnaryOp):
+        return [node.operand]
+    elif isinstance(node, ast.Compare):
+        return [node.left, *node.comparators]
+    elif isinstance(node, ast.Call):
+        return [*node.args, *(keyword.value for keyword in node.keywords)]
+    elif isinstance(node, (ast.List, ast.Tuple)):
+        return list(node.elts)
+    return []
+
+
+def _replace_operands(node: ast.AST, operands: list[ast.AST]) -> None:
+    """Store folded child expressions back on a node (see ``_operands``)."""
+    if isinstance(node, ast.BinOp):
+        node.left, node.right = operands
+    elif isinstance(node, ast.UnaryOp):
+        node.operand, = operands
+    elif isinstance(node, ast.Compare):
+        node.left, *node.comparators = operands
+    elif isinstance(node, ast.Call):
+        node.args = operands[:len(node.args)]
+        for keyword, value in zip(node.keywords, operands[len(node.args):]):
+            keyword.value = value
+    elif isinstance(node, (ast.List, ast.Tuple)):
+        node.elts = operands
+
+
+def _fold_node(node: ast.AST) -> ast.AST:
+    """Fold a single node whose children have already been folded."""
+    if isinstance(node, ast.Name):
+        if node.id in _CONSTANT_NAMES:
+            return ast.copy_location(ast.Constant(_SAFE_NAMES[node.id]), node)
+        return node
+
+    if isinstance(node, ast.Tuple):
+        if all(isinstance(item, ast.Constant) for item in node.elts):
+            value = tuple(item.value for item in node.elts)
+            return ast.copy_location(ast.Constant(value), node)
+        return node
+
+    # Lists keep their container, so each evaluation returns a fresh list
+    if not isinstance(node, (ast.BinOp, ast.UnaryOp, ast.Compare, ast.Call)):
+        return node
+    if not all(_is_literal(operand) for operand in _operands(node)):
+        return node
+    try:
+        value = _build(node)()
+    except Exception:
+        return node
+    if isinstance(value, list):
+        return node
+    return ast.copy_location(ast.Constant(value), node)
+
+
+def _is_literal(node: ast.AST) -> bool:
+    """Check for a constant or a list of constants, as in ``sum([1, 2])``."""
+    if isinstance(node, ast.List):
+        return all(isinstance(item, ast.Constant) for item in node.elts)
+    return isinstance(node, ast.Constant)
+
+
+def _fold(root: ast.AST) -> ast.AST:
+    """Collapse subtrees with only constant operands into ``ast.Constant`` nodes.
+
+    Subtrees that fail to evaluate (e.g. division by zero) or are unsafe are
+    left as they are, so the error is raised by ``_build`` or at evaluation
+    time exactly as without folding. The tree is walked in post-order with
+    an explicit stack, so long chains like ``1+1+...+1`` fold without
+    hitting the recursion limit.
+
+    Args:
+        root: AST node to fold
+
+    Returns:
+        The folded node
+    """
+    folded: list[ast.AST] = []
+    stack = [(root, False)]
+    while stack:
+        node, expanded = stack.pop()
+        operands = _operands(node)
+        if operands and not expanded:
+            # Revisit the node once all of its operands are folded
+            stack.append((node, True))
+            stack.extend((operand, False) for operand in reversed(operands))
+            continue
+        if operands:
+            _replace_operands(node, folded[-len(operands):])
+            del folded[-len(operands):]
+        folded.append(_fold_node(node))
+    return folded[0]
+
+
+def _build_constant(node: ast.Constant, operands: list) -> Callable[[], Any]:
+    """Build a literal (Python 3.8+ - numbers, strings, etc.)."""
+    value = node.value
+    return lambda: value
+
+
+def _build_name(node: ast.Name, operands: list) -> Callable[[], Any]:
+    """Build a variable/constant lookup."""
+    if node.id not in _SAFE_NAMES:
+        raise ValueError(f"Unsafe name: {node.id}")
+    value = _SAFE_NAMES[node.id]
+    return lambda: value
+
+
+def _build_binop(node: ast.BinOp, operands: list) -> Callable[[], Any]:
+    """Build a binary operation (e.g., 2 + 3)."""
+    if type(node.op) not in _SAFE_OPERATORS:
+        raise ValueError(f"Unsafe operator: {type(node.op).__name__}")
+
+    op = _SAFE_OPERATORS[type(node.op)]
+    left, right = operands
+    # Bake literal operands into the closure instead of calling a thunk
+    if isinstance(node.left, ast.Constant):
+        left_value = node.left.value
+        return lambda: op(left_value, right())
+    if isinstance(node.right, ast.Constant):
+        right_value = node.right.value
+        return lambda: op(left(), right_value)
+    closure = _BINOP_CLOSURES.get(type(node.op))
+    if closure is not None:
+        return closure(left, right)
+    return lambda: op(left(), right())
+
+
+def _build_unaryop(node: ast.UnaryOp, operands: list) -> Callable[[], Any]:
+    """Build a unary operation (e.g., -5)."""
+    if type(node.op) not in _SAFE_OPERATORS:
+        raise ValueError(f"Unsafe unary operator: {type(node.op).__name__}")
+
+    op = _SAFE_OPERATORS[type(node.op)]
+    operand, = operands
+    return lambda: op(operand())
+
+
+def _build_compare(node: ast.Compare, operands: list) -> Callable[[], Any]:
+    """Build a comparison (e.g., 5 > 3)."""
+    first, *comparators = operands
+    steps = []
+    for op, comparator in zip(node.ops, comparators):
+        if type(op) not in _SAFE_OPERATORS:
+            raise ValueError(f"Unsafe comparison: {type(op).__name__}")
+        steps.append((_SAFE_OPERATORS[type(op)], comparator))
+
+    if len(steps) == 1:
+        # Single comparison, the common case: no loop needed
+        (op, second), = steps
+        return lambda: op(first(), second())
+
+    def compare() -> bool:
+        left = first()
+        for op, comparator in steps:
+            right = comparator()
+            if not op(left, right):
+                return False
+            left = right
+        return True
+
+    return compare
+
+
+def _build_call(node: ast.Call, operands: list) -> Callable[[], Any]:
+    """Build a function call (e.g., sin(0.5))."""
+    if not isinstance(node.func, ast.Name):
+        raise ValueError("Only simple function calls allowed")
+
+    func_name = node.func.id
+    if func_name not in _SAFE_NAMES:
+        raise ValueError(f"Unsafe function: {func_name}")
+
+    func = _SAFE_NAMES[func_name]
+    args = operands[:len(node.args)]
+
+    # Handle keyword arguments if any
+    if node.keywords:
+        keywords = [
+            (keyword.arg, value)
+            for keyword, value in zip(node.keywords, operands[len(node.args):])
+        ]
+        return lambda: func(
+            *[arg() for arg in args],
+            **{name: value() for name, value in keywords},
+        )
+
+    # Fixed-arity forms for the common cases, e.g. sqrt(x) and gcd(a, b)
+    if len(args) == 1:
+        if isinstance(node.args[0], ast.Constant):
+            value = node.args[0].value
+            return lambda: func(value)
+        arg, = args
+        return lambda: func(arg())
+    if len(args) == 2:
+        first, second = args
+        return lambda: func(first(), second())
+    return lambda: func(*[arg() for arg in args])
+
+
+def _build_list(node: ast.List, operands: list) -> Callable[[], Any]:
+    """Build a list literal (e.g., [1, 2, 3])."""
+    items = operands
+    return lambda: [item() for item in items]
+
+
+def _build_tuple(node: ast.Tuple, operands: list) -> Callable[[], Any]:
+    """Build a tuple literal (e.g., (1, 2, 3))."""
+    items = operands
+    return lambda: tuple(item() for item in items)
+
+
+# Builders keyed by exact node type, so dispatch is a single dict lookup.
+# Each takes the node and the closures already built for its operands
+# (see ``_operands``).
+_BUILDERS: Dict[type, Callable[[Any, list], Callable[[], Any]]] = {
+    ast.Constant: _build_constant,
+    ast.Name: _build_name,
+    ast.BinOp: _build_binop,
+    ast.UnaryOp: _build_unaryop,
+    ast.Compare: _build_compare,
+    ast.Call: _build_call,
+    ast.List: _build_list,
+    ast.Tuple: _build_tuple,
+}
+
+
+def _build(root: ast.AST) -> Callable[[], Any]:
+    """Build a closure evaluating an AST node.
+
+    Names, functions and operators are validated and resolved here, once,
+    so evaluating the result only calls the nested closures. Like
+    ``_fold``, the tree is walked in post-order with an explicit stack, so
+    deep expressions don't hit the recursion limit while building.
+
+    Args:
+        root: AST node to compile
+
+    Returns:
+        Zero-argument callable returning the node's value
+
+    Raises:
+        ValueError: If unsafe operation attempted
+    """
+    built: list[Callable[[], Any]] = []
+    stack = [(root, False)]
+    while stack:
+        node, expanded = stack.pop()
+        builder = _BUILDERS.get(type(node))
+        if builder is None:
+            raise ValueError(f"Unsafe node type: {type(node).__name__}")
+        operands = _operands(node)
+        if operands and not expanded:
+            # Revisit the node once all of its operands are built
+            stack.append((node, True))
+            stack.extend((operand, False) for operand in reversed(operands))
+            continue
+        if operands:
+            closures = built[-len(operands):]
+            del built[-len(operands):]
+        else:
+            closures = []
+        built.append(builder(node, closures))
+    return built[0]
+
 
 class MathTool(Tool):
     """Safe mathematical expression evaluator.
@@ -14,6 +447,15 @@ class MathTool(Tool):
     which can make arithmetic errors. Safer and more efficient than model-based math.
     """
 
+    _PARAMETERS = [
+        ToolParameter(
+            name="expression",
+            type=ToolParameterType.STRING,
+            description="Mathematical expression to evaluate (e.g., '2 + 2', 'sqrt(16)', 'sin(pi/4)')",
+            required=True,
+        ),
+    ]
+
     @property
     def name(self) -> str:
         return "Math"
@@ -46,18 +488,24 @@ The model can make arithmetic errors, but this tool is always accurate."""
 
     @property
     def parameters(self) -> list[ToolParameter]:
-        return [
-            ToolParameter(
-                name="expression",
-                type=ToolParameterType.STRING,
-                description="Mathematical expression to evaluate (e.g., '2 + 2', 'sqrt(16)', 'sin(pi/4)')",
-                required=True,
-            ),
-        ]
+        return self._PARAMETERS
 
     async def execute(self, expression: str, **kwargs: Any) -> ToolResult:
         """Safely evaluate mathematical expression.
 
+        Args:
+            expression: Math expression to evaluate
+
+        Returns:
+            ToolResult with calculated value
+        """
+        return self.evaluate(expression)
+
+    def evaluate(self, expression: str) -> ToolResult:
+        """Synchronous version of ``execute`` for callers outside the event loop.
+
+        Evaluation never blocks on I/O, so this does the actual work.
+
         Args:
             expression: Math expression to evaluate
 
@@ -65,95 +513,13 @@ The model can make arithmetic errors, but this tool is always accurate."""
             ToolResult with calculated value
         """
         try:
-            # Define safe operations
-            safe_operators = {
-                ast.Add: operator.add,
-                ast.Sub: operator.sub,
-                ast.Mult: operator.mul,
-                ast.Div: operator.truediv,
-                ast.FloorDiv: operator.floordiv,
-                ast.Mod: operator.mod,
-                ast.Pow: operator.pow,
-                ast.USub: operator.neg,
-                ast.UAdd: operator.pos,
-                # Comparisons
-                ast.Lt: operator.lt,
-                ast.LtE: operator.le,
-                ast.Gt: operator.gt,
-                ast.GtE: operator.ge,
-                ast.Eq: operator.eq,
-                ast.NotEq: operator.ne,
-            }
-
-            # Define safe functions and constants
-            safe_names = {
-                # Trigonometric functions
-                'sin': math.sin,
-                'cos': math.cos,
-                'tan': math.tan,
-                'asin': math.asin,
-                'acos': math.acos,
-                'atan': math.atan,
-                'atan2': math.atan2,
-                'sinh': math.sinh,
-                'cosh': math.cosh,
-                'tanh': math.tanh,
-
-                # Exponential and logarithmic
-                'exp': math.exp,
-                'log': math.log,
-                'log10': math.log10,
-                'log2': math.log2,
-                'sqrt': math.sqrt,
-
-                # Power and roots
-                'pow': pow,
-
-                # Rounding
-                'abs': abs,
-                'round': round,
-                'ceil': math.ceil,
-                'floor': math.floor,
-                'trunc': math.trunc,
-
-                # Special functions
-                'factorial': math.factorial,
-                'gcd': math.gcd,
-
-                # Conversion
-                'degrees': math.degrees,
-                'radians': math.radians,
-
-                # Constants
-                'pi': math.pi,
-                'e': math.e,
-                'tau': math.tau,
-                'inf': math.inf,
-                'nan': math.nan,
-
-                # Min/max
-                'min': min,
-                'max': max,
-
-                # Sum (for lists)
-                'sum': sum,
-            }
-
-            # Parse the expression
-            parsed = ast.parse(expression, mode='eval')
-
-            # Evaluate safely
-            result = self._eval_node(parsed.body, safe_operators, safe_names)
+            result = _compile(expression)()
 
             # Format result nicely
-            if isinstance(result, float):
-                # Show reasonable precision
-                if result == int(result):
-                    output = str(int(result))
-                else:
-                    output = str(result)
-            elif isinstance(result, bool):
-                output = str(result)
+            if isinstance(result, float) and result.is_integer():
+                # Show whole floats without the trailing .0; is_integer()
+                # is False for inf and nan, which are shown as they are
+                output = str(int(result))
             else:
                 output = str(result)
 
@@ -191,97 +557,3 @@ The model can make arithmetic errors, but this tool is always accurate."""
                 output="",
                 error=f"Evaluation failed: {str(e)}",
             )
-
-    def _eval_node(
-        self,
-        node: ast.AST,
-        operators: Dict[type, Callable],
-        names: Dict[str, Any],
-    ) -> Any:
-        """Recursively evaluate AST node safely.
-
-        Args:
-            node: AST node to evaluate
-            operators: Allowed operators
-            names: Allowed names (functions/constants)
-
-        Returns:
-            Evaluated result
-
-        Raises:
-            ValueError: If unsafe operation attempted
-        """
-        if isinstance(node, ast.Constant):
-            # Python 3.8+ - numbers, strings, etc.
-            return node.value
-
-        elif isinstance(node, ast.Name):
-            # Variable/constant lookup
-            if node.id in names:
-                return names[node.id]
-            else:
-                raise ValueError(f"Unsafe name: {node.id}")
-
-        elif isinstance(node, ast.BinOp):
-            # Binary operation (e.g., 2 + 3)
-            if type(node.op) not in operators:
-                raise ValueError(f"Unsafe operator: {type(node.op).__name__}")
-
-            left = self._eval_node(node.left, operators, names)
-            right = self._eval_node(node.right, operators, names)
-            return operators[type(node.op)](left, right)
-
-        elif isinstance(node, ast.UnaryOp):
-            # Unary operation (e.g., -5)
-            if type(node.op) not in operators:
-                raise ValueError(f"Unsafe unary operator: {type(node.op).__name__}")
-
-            operand = self._eval_node(node.operand, operators, names)
-            return operators[type(node.op)](operand)
-
-        elif isinstance(node, ast.Compare):
-            # Comparison (e.g., 5 > 3)
-            left = self._eval_node(node.left, operators, names)
-
-            for op, comparator in zip(node.ops, node.comparators):
-                if type(op) not in operators:
-                    raise ValueError(f"Unsafe comparison: {type(op).__name__}")
-
-                right = self._eval_node(comparator, operators, names)
-                result = operators[type(op)](left, right)
-
-                if not result:
-                    return False
-                left = right
-
-            return True
-
-        elif isinstance(node, ast.Call):
-            # Function call (e.g., sin(0.5))
-            if not isinstance(node.func, ast.Name):
-                raise ValueError("Only simple function calls allowed")
-
-            func_name = node.func.id
-            if func_name not in names:
-                raise ValueError(f"Unsafe function: {func_name}")
-
-            func = names[func_name]
-            args = [self._eval_node(arg, operators, names) for arg in node.args]
-
-            # Handle keyword arguments if any
-            kwargs = {}
-            for keyword in node.keywords:
-                kwargs[keyword.arg] = self._eval_node(keyword.value, operators, names)
-
-            return func(*args, **kwargs)
-
-        elif isinstance(node, ast.List):
-            # List literal (e.g., [1, 2, 3])
-            return [self._eval_node(item, operators, names) for item in node.elts]
-
-        elif isinstance(node, ast.Tuple):
-            # Tuple literal (e.g., (1, 2, 3))
-            return tuple(self._eval_node(item, operators, names) for item in node.elts)
-
-        else:
-            raise ValueError(f"Unsafe node type: {type(node).__name__}")
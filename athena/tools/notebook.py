@@ -1,10 +1,94 @@
 """Jupyter Notebook tools for interactive development."""
 
+import asyncio
+import atexit
 import json
 import os
+import queue
+import shutil
 from typing import Any, Optional, List
 from athena.models.tool import Tool, ToolParameter, ToolParameterType, ToolResult
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+# Running kernels keyed by (notebook path, kernel name). Reusing them skips
+# kernel startup on repeated executions; they are shut down at exit.
+_KERNEL_CACHE: dict[tuple[str, str], tuple[Any, Any]] = {}
+_MAX_KERNELS = 4
+
+
+def _stop_kernel(km: Any, kc: Any) -> None:
+    """Stop a kernel's channels and shut it down, ignoring errors."""
+    try:
+        kc.stop_channels()
+        km.shutdown_kernel(now=True)
+    except Exception:
+        pass
+
+
+def _shutdown_kernels() -> None:
+    """Shut down all cached kernels."""
+    while _KERNEL_CACHE:
+        _, (km, kc) = _KERNEL_CACHE.popitem()
+        _stop_kernel(km, kc)
+
+
+atexit.register(_shutdown_kernels)
+
+
+# Whitespace and UTF-8 BOM bytes allowed before a notebook's opening brace
+_LEADING_BYTES = b' \t\r\n\xef\xbb\xbf'
+
+
+def _load_notebook(path: str) -> dict:
+    """Load a notebook file, parsing with orjson when it is installed.
+
+    Raises:
+        json.JSONDecodeError: If the file is not valid JSON (orjson's
+            error is a subclass)
+    """
+    with open(path, 'rb') as f:
+        # A notebook is a JSON object; reject anything else (HTML, binary
+        # files) from its first bytes instead of reading all of it
+        head = f.read(64)
+        if not head.lstrip(_LEADING_BYTES).startswith(b'{'):
+            raise json.JSONDecodeError(
+                "Expecting a notebook JSON object", head.decode('utf-8', 'replace'), 0
+            )
+        data = head + f.read()
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _save_notebook(path: str, notebook: dict) -> None:
+    """Write a notebook file in the usual nbformat layout (one-space indent).
+
+    The notebook is serialized up front and written in one call to a
+    temporary file that then replaces the original, so a failed save never
+    leaves a truncated notebook behind.
+    """
+    # Non-ASCII text is written as-is, like Jupyter does, instead of as
+    # \uXXXX escapes
+    payload = json.dumps(notebook, indent=1, ensure_ascii=False)
+    target = os.path.realpath(path)
+    tmp_path = f"{target}.tmp"
+    try:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(payload)
+        if os.path.exists(target):
+            shutil.copymode(target, tmp_path)
+        os.replace(tmp_path, target)
+    except Exception:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
 
 def _format_source(content: str) -> List[str]:
     """Format content as Jupyter notebook source (list of strings with newlines).
@@ -15,12 +99,120 @@ def _format_source(content: str) -> List[str]:
     Example:
         "line1\\nline2\\nline3" -> ["line1\\n", "line2\\n", "line3"]
     """
-    if not content:
-        return []
+    # Same split nbformat uses; joining the list gives back the content
+    return content.splitlines(keepends=True)
+
+
+def _format_stream(output: dict, result_lines: List[str]) -> None:
+    """Format stdout/stderr output."""
+    text = output.get('text', [])
+    if isinstance(text, list):
+        text = ''.join(text)
+    result_lines.append(f"[stream:{output.get('name', 'stdout')}]")
+    result_lines.append(text.rstrip())
+
+
+def _format_execute_result(output: dict, result_lines: List[str]) -> None:
+    """Format the result of an expression."""
+    data = output.get('data', {})
+    if 'text/plain' in data:
+        text = data['text/plain']
+        if isinstance(text, list):
+            text = ''.join(text)
+        result_lines.append("[result]")
+        result_lines.append(text.rstrip())
+    elif 'text/html' in data:
+        result_lines.append("[HTML output - not displayed]")
+    elif 'image/png' in data:
+        result_lines.append("[PNG image - not displayed]")
+    else:
+        result_lines.append(f"[{', '.join(data.keys())}]")
+
+
+def _format_display_data(output: dict, result_lines: List[str]) -> None:
+    """Format display output (plots, images, etc.)."""
+    data = output.get('data', {})
+    if 'text/plain' in data:
+        text = data['text/plain']
+        if isinstance(text, list):
+            text = ''.join(text)
+        result_lines.append("[display]")
+        result_lines.append(text.rstrip())
+    elif 'image/png' in data:
+        result_lines.append("[PNG image]")
+    elif 'image/jpeg' in data:
+        result_lines.append("[JPEG image]")
+    else:
+        result_lines.append(f"[display: {', '.join(data.keys())}]")
+
+
+def _format_error(output: dict, result_lines: List[str]) -> None:
+    """Format an error and its traceback."""
+    ename = output.get('ename', 'Error')
+    evalue = output.get('evalue', '')
+    result_lines.append(f"[error: {ename}]")
+    result_lines.append(evalue)
+
+    # Show traceback if available
+    traceback = output.get('traceback', [])
+    if traceback:
+        result_lines.append("")
+        result_lines.extend(traceback[:5])  # Limit traceback lines
+        if len(traceback) > 5:
+            result_lines.append(f"... ({len(traceback) - 5} more lines)")
+
+
+def _replace_is_noop(cell: dict, content: str, cell_type: str) -> bool:
+    """Check whether replacing a cell would leave it exactly as it is.
+
+    Besides type and source, a replaced code cell has its outputs cleared,
+    so a code cell that still has outputs is not a no-op.
+    """
+    if cell.get('cell_type') != cell_type:
+        return False
+
+    source = cell.get('source', [])
+    if isinstance(source, list):
+        source = ''.join(source)
+    if source != content:
+        return False
+
+    if cell_type == 'code':
+        return cell.get('outputs') == [] and 'execution_count' in cell and cell['execution_count'] is None
+    return 'outputs' not in cell and 'execution_count' not in cell
+
+
+# Rules drawn under the notebook header and after each cell
+_NOTEBOOK_RULE = "=" * 70
+_CELL_RULE = "-" * 70
+
+# Output data that NotebookRead only reports by type, never by content
+_UNDISPLAYED_MIME_TYPES = ('image/png', 'image/jpeg', 'text/html')
+
+
+def _drop_undisplayed_data(cells: List[dict]) -> None:
+    """Blank out output payloads that are never displayed.
+
+    Base64 images and HTML can make up most of a notebook's size; dropping
+    them right after parsing frees that memory while the rest is formatted.
+    The keys are kept, since the formatters report which types are present.
+    """
+    for cell in cells:
+        for output in cell.get('outputs') or ():
+            data = output.get('data')
+            if data:
+                for mime_type in _UNDISPLAYED_MIME_TYPES:
+                    if mime_type in data:
+                        data[mime_type] = ""
+
 
-    lines = content.split('\n')
-    # Add newline to all lines except the last
-    return [line + '\n' for line in lines[:-1]] + [lines[-1]]
+# Output formatters keyed by output_type; other types are not displayed
+_OUTPUT_FORMATTERS = {
+    'stream': _format_stream,
+    'execute_result': _format_execute_result,
+    'display_data': _format_display_data,
+    'error': _format_error,
+}
 
 
 class NotebookReadTool(Tool):
@@ -65,26 +257,25 @@ Example: NotebookRead(path="analysis.ipynb")"""
             # Expand path
             path = os.path.expanduser(path)
 
-            # Check file exists
-            if not os.path.exists(path):
+            # Check it's a .ipynb file
+            if not path.endswith('.ipynb'):
                 return ToolResult(
                     success=False,
                     output="",
-                    error=f"Notebook not found: {path}"
+                    error=f"Not a Jupyter notebook file (expected .ipynb): {path}"
                 )
 
-            # Check it's a .ipynb file
-            if not path.endswith('.ipynb'):
+            # Load notebook off the event loop; opening it doubles as the
+            # existence check
+            try:
+                notebook = await asyncio.to_thread(_load_notebook, path)
+            except FileNotFoundError:
                 return ToolResult(
                     success=False,
                     output="",
-                    error=f"Not a Jupyter notebook file (expected .ipynb): {path}"
+                    error=f"Notebook not found: {path}"
                 )
 
-            # Load notebook
-            with open(path, 'r') as f:
-                notebook = json.load(f)
-
             # Validate notebook structure
             if 'cells' not in notebook:
                 return ToolResult(
@@ -93,6 +284,8 @@ Example: NotebookRead(path="analysis.ipynb")"""
                     error="Invalid notebook format: missing 'cells' field"
                 )
 
+            _drop_undisplayed_data(notebook['cells'])
+
             # Format notebook contents
             output_lines = []
             output_lines.append(f"📓 Notebook: {os.path.basename(path)}")
@@ -104,42 +297,39 @@ Example: NotebookRead(path="analysis.ipynb")"""
                 kernel_name = kernel_spec.get('display_name', kernel_spec.get('name', 'Unknown'))
                 output_lines.append(f"Kernel: {kernel_name}")
 
-            output_lines.append("")
-            output_lines.append("=" * 70)
+            output_lines.append(f"\n{_NOTEBOOK_RULE}")
 
-            # Display each cell
+            # Display each cell. Blank separator lines are folded into the
+            # entry that follows them, which halves the list appends.
             for i, cell in enumerate(notebook['cells']):
-                cell_type = cell.get('cell_type', 'unknown')
-                source = cell.get('source', [])
+                cell_get = cell.get
+                cell_type = cell_get('cell_type', 'unknown')
+                source = cell_get('source', [])
 
-                # Convert source to string (can be list or string)
-                if isinstance(source, list):
+                # Convert source to string (can be list or string); parsed
+                # JSON never holds list subclasses, so an identity check works
+                if type(source) is list:
                     source_text = ''.join(source)
                 else:
                     source_text = source
 
-                output_lines.append("")
-                output_lines.append(f"Cell {i} [{cell_type}]:")
+                output_lines.append(f"\nCell {i} [{cell_type}]:")
 
                 # Show execution count for code cells
                 if cell_type == 'code':
-                    exec_count = cell.get('execution_count')
+                    exec_count = cell_get('execution_count')
                     if exec_count is not None:
                         output_lines.append(f"Execution count: {exec_count}")
 
-                output_lines.append("")
-                output_lines.append(source_text)
+                output_lines.append(f"\n{source_text}")
 
                 # Show outputs for code cells
                 if cell_type == 'code' and 'outputs' in cell:
                     outputs = cell['outputs']
                     if outputs:
-                        output_lines.append("")
-                        output_lines.append("Output:")
-                        output_lines.append(self._format_outputs(outputs))
+                        output_lines.append(f"\nOutput:\n{self._format_outputs(outputs)}")
 
-                output_lines.append("")
-                output_lines.append("-" * 70)
+                output_lines.append(f"\n{_CELL_RULE}")
 
             return ToolResult(
                 success=True,
@@ -169,62 +359,9 @@ Example: NotebookRead(path="analysis.ipynb")"""
         result_lines = []
 
         for output in outputs:
-            output_type = output.get('output_type', 'unknown')
-
-            if output_type == 'stream':
-                # stdout/stderr output
-                text = output.get('text', [])
-                if isinstance(text, list):
-                    text = ''.join(text)
-                result_lines.append(f"[stream:{output.get('name', 'stdout')}]")
-                result_lines.append(text.rstrip())
-
-            elif output_type == 'execute_result':
-                # Result of expression
-                data = output.get('data', {})
-                if 'text/plain' in data:
-                    text = data['text/plain']
-                    if isinstance(text, list):
-                        text = ''.join(text)
-                    result_lines.append("[result]")
-                    result_lines.append(text.rstrip())
-                elif 'text/html' in data:
-                    result_lines.append("[HTML output - not displayed]")
-                elif 'image/png' in data:
-                    result_lines.append("[PNG image - not displayed]")
-                else:
-                    result_lines.append(f"[{', '.join(data.keys())}]")
-
-            elif output_type == 'display_data':
-                # Display output (plots, images, etc.)
-                data = output.get('data', {})
-                if 'text/plain' in data:
-                    text = data['text/plain']
-                    if isinstance(text, list):
-                        text = ''.join(text)
-                    result_lines.append("[display]")
-                    result_lines.append(text.rstrip())
-                elif 'image/png' in data:
-                    result_lines.append("[PNG image]")
-                elif 'image/jpeg' in data:
-                    result_lines.append("[JPEG image]")
-                else:
-                    result_lines.append(f"[display: {', '.join(data.keys())}]")
-
-            elif output_type == 'error':
-                # Error/traceback
-                ename = output.get('ename', 'Error')
-                evalue = output.get('evalue', '')
-                result_lines.append(f"[error: {ename}]")
-                result_lines.append(evalue)
-
-                # Show traceback if available
-                traceback = output.get('traceback', [])
-                if traceback:
-                    result_lines.append("")
-                    result_lines.extend(traceback[:5])  # Limit traceback lines
-                    if len(traceback) > 5:
-                        result_lines.append(f"... ({len(traceback) - 5} more lines)")
+            formatter = _OUTPUT_FORMATTERS.get(output.get('output_type', 'unknown'))
+            if formatter is not None:
+                formatter(output, result_lines)
 
         return "\n".join(result_lines) if result_lines else "[no output]"
 
@@ -305,14 +442,6 @@ Examples:
             # Expand path
             path = os.path.expanduser(path)
 
-            # Check file exists
-            if not os.path.exists(path):
-                return ToolResult(
-                    success=False,
-                    output="",
-                    error=f"Notebook not found: {path}"
-                )
-
             # Validate action
             if action not in ['replace', 'insert', 'delete']:
                 return ToolResult(
@@ -329,9 +458,16 @@ Examples:
                     error=f"Invalid cell_type '{cell_type}'. Must be: code or markdown"
                 )
 
-            # Load notebook
-            with open(path, 'r') as f:
-                notebook = json.load(f)
+            # Load notebook off the event loop; opening it doubles as the
+            # existence check
+            try:
+                notebook = await asyncio.to_thread(_load_notebook, path)
+            except FileNotFoundError:
+                return ToolResult(
+                    success=False,
+                    output="",
+                    error=f"Notebook not found: {path}"
+                )
 
             cells = notebook.get('cells', [])
 
@@ -362,6 +498,19 @@ Examples:
                         error="content parameter required for replace action"
                     )
 
+                # Retried edits often change nothing; skip rewriting the file
+                if _replace_is_noop(cells[cell_number], content, cell_type):
+                    return ToolResult(
+                        success=True,
+                        output=f"Cell {cell_number} already has this content ({cell_type}); no change",
+                        metadata={
+                            "path": path,
+                            "action": action,
+                            "cell_number": cell_number,
+                            "total_cells": len(cells)
+                        }
+                    )
+
                 cells[cell_number]['cell_type'] = cell_type
                 cells[cell_number]['source'] = _format_source(content)
 
@@ -405,8 +554,7 @@ Examples:
             notebook['cells'] = cells
 
             # Save notebook
-            with open(path, 'w') as f:
-                json.dump(notebook, f, indent=1)
+            await asyncio.to_thread(_save_notebook, path, notebook)
 
             return ToolResult(
                 success=True,
@@ -449,6 +597,8 @@ class NotebookExecuteTool(Tool):
         return """Execute Jupyter notebook cells and capture outputs.
 
 Runs code cells using a Jupyter kernel and updates the notebook with results.
+The kernel keeps running between calls, so variables defined by earlier
+executions of the same notebook stay available.
 
 IMPORTANT: Requires jupyter_client installed: pip install jupyter-client ipykernel
 
@@ -509,18 +659,17 @@ Examples:
             # Expand path
             path = os.path.expanduser(path)
 
-            # Check file exists
-            if not os.path.exists(path):
+            # Load notebook off the event loop; opening it doubles as the
+            # existence check
+            try:
+                notebook = await asyncio.to_thread(_load_notebook, path)
+            except FileNotFoundError:
                 return ToolResult(
                     success=False,
                     output="",
                     error=f"Notebook not found: {path}"
                 )
 
-            # Load notebook
-            with open(path, 'r') as f:
-                notebook = json.load(f)
-
             cells = notebook.get('cells', [])
 
             # Determine which cells to execute
@@ -561,27 +710,47 @@ Examples:
                     metadata={"cells_executed": 0}
                 )
 
-            # Start kernel
-            km = KernelManager(kernel_name=kernel)
-            km.start_kernel()
-            kc = km.client()
-            kc.start_channels()
+            # Reuse this notebook's kernel if it is still running
+            key = (os.path.realpath(path), kernel)
+            cached = _KERNEL_CACHE.pop(key, None)
+            if cached is not None and cached[0].is_alive():
+                km, kc = cached
+            else:
+                if cached is not None:
+                    _stop_kernel(*cached)
 
-            # Wait for kernel to be ready
-            try:
-                kc.wait_for_ready(timeout=timeout)
-            except Exception as e:
-                km.shutdown_kernel()
-                return ToolResult(
-                    success=False,
-                    output="",
-                    error=f"Kernel failed to start: {str(e)}"
-                )
+                # Start kernel
+                km = KernelManager(kernel_name=kernel)
+                km.start_kernel()
+                kc = km.client()
+                kc.start_channels()
+
+                # Wait for kernel to be ready
+                try:
+                    kc.wait_for_ready(timeout=timeout)
+                except Exception as e:
+                    _stop_kernel(km, kc)
+                    return ToolResult(
+                        success=False,
+                        output="",
+                        error=f"Kernel failed to start: {str(e)}"
+                    )
+
+            # Most recently used last; evict the oldest kernels beyond the limit
+            _KERNEL_CACHE[key] = (km, kc)
+            while len(_KERNEL_CACHE) > _MAX_KERNELS:
+                oldest = next(iter(_KERNEL_CACHE))
+                _stop_kernel(*_KERNEL_CACHE.pop(oldest))
 
             execution_results = []
+            timed_out = None
 
             # Execute cells
             for idx, cell in cells_to_execute:
+                if timed_out is not None:
+                    execution_results.append(f"Cell {idx}: skipped (kernel stopped after timeout)")
+                    continue
+
                 source = cell.get('source', [])
                 if isinstance(source, list):
                     code = ''.join(source)
@@ -622,11 +791,21 @@ Examples:
                             })
 
                         elif msg_type == 'stream':
-                            cell_outputs.append({
-                                'output_type': 'stream',
-                                'name': content['name'],
-                                'text': content['text']
-                            })
+                            # Merge consecutive chunks from the same stream into
+                            # one output, as Jupyter does when saving
+                            last = cell_outputs[-1] if cell_outputs else None
+                            if (
+                                last is not None
+                                and last['output_type'] == 'stream'
+                                and last['name'] == content['name']
+                            ):
+                                last['text'] += content['text']
+                            else:
+                                cell_outputs.append({
+                                    'output_type': 'stream',
+                                    'name': content['name'],
+                                    'text': content['text']
+                                })
 
                         elif msg_type == 'display_data':
                             cell_outputs.append({
@@ -646,6 +825,13 @@ Examples:
                         elif msg_type == 'status' and content['execution_state'] == 'idle':
                             break
 
+                    except queue.Empty:
+                        # The cell is still running; stop its kernel so the
+                        # next execution doesn't queue behind it
+                        timed_out = idx
+                        _KERNEL_CACHE.pop(key, None)
+                        _stop_kernel(km, kc)
+                        break
                     except Exception:
                         break
 
@@ -656,19 +842,24 @@ Examples:
                 # Report result
                 output_count = len(cell_outputs)
                 has_error = any(out.get('output_type') == 'error' for out in cell_outputs)
-                status = "✗ error" if has_error else "✓ success"
+                if timed_out is not None:
+                    status = f"✗ timed out after {timeout}s"
+                else:
+                    status = "✗ error" if has_error else "✓ success"
                 execution_results.append(f"Cell {idx}: {status} ({output_count} outputs)")
 
-            # Cleanup kernel
-            kc.stop_channels()
-            km.shutdown_kernel()
-
             # Update notebook
             notebook['cells'] = cells
 
             # Save notebook
-            with open(path, 'w') as f:
-                json.dump(notebook, f, indent=1)
+            await asyncio.to_thread(_save_notebook, path, notebook)
+
+            if timed_out is not None:
+                return ToolResult(
+                    success=False,
+                    output="\n".join(execution_results),
+                    error=f"Cell {timed_out} timed out after {timeout}s; its kernel was shut down"
+                )
 
             return ToolResult(
                 success=True,
@@ -808,8 +999,7 @@ Examples:
             }
 
             # Write notebook
-            with open(path, 'w') as f:
-                json.dump(notebook, f, indent=1)
+            await asyncio.to_thread(_save_notebook, path, notebook)
 
             return ToolResult(
                 success=True,
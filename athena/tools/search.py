@@ -1,10 +1,114 @@
 """Search tools."""
 
+import asyncio
+import fnmatch
+import os
 import re
+from operator import itemgetter
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Callable, Iterator, Optional
 from athena.models.tool import Tool, ToolParameter, ToolParameterType, ToolResult
 
+# Files GrepTool scans concurrently, each in its own worker thread
+_SCAN_BATCH_SIZE = 64
+
+# Characters that make a pattern component a wildcard rather than a literal name
+_GLOB_MAGIC_RE = re.compile(r"[*?[]")
+
+# Directories skipped while expanding "**"; naming them explicitly in the
+# pattern (e.g. "node_modules/**/*.js") still searches them
+_PRUNED_DIRS = frozenset({".git", "node_modules", "__pycache__"})
+
+
+def _component_matcher(part: str) -> Callable[[str], Any]:
+    """Build a matcher for one path component of a glob pattern."""
+    return re.compile(fnmatch.translate(part)).match
+
+
+def _walk_glob(root: str, pattern: str) -> Iterator[tuple[str, float]]:
+    """Find files matching a glob pattern using os.scandir.
+
+    Follows ``Path.glob`` semantics: ``*``, ``?`` and ``[...]`` match within
+    one path component and ``**`` matches any number of directories.
+    Directory entries from scandir carry their file type, so each match
+    costs a single stat (for its mtime) instead of separate stat and
+    is_file calls.
+
+    Args:
+        root: Directory to search from
+        pattern: Relative glob pattern
+
+    Yields:
+        (path, mtime) for each matching file
+    """
+    if not pattern:
+        raise ValueError(f"Unacceptable pattern: {pattern!r}")
+    if os.path.isabs(pattern):
+        raise NotImplementedError("Non-relative patterns are unsupported")
+
+    if pattern.endswith("/"):
+        # Like Path.glob, a trailing slash only matches directories
+        return
+
+    parts = [part for part in pattern.split("/") if part]
+    matchers = [None if part == "**" else _component_matcher(part) for part in parts]
+    last = len(parts) - 1
+    seen = set()
+
+    # (directory, index of the pattern component to match in it), walked
+    # depth-first from an explicit stack so deep trees don't hit the
+    # recursion limit; entries are pushed in reverse to keep scan order
+    stack = [(root, 0)]
+    while stack:
+        directory, index = stack.pop()
+        part = parts[index]
+
+        if part == "**":
+            if index == last:
+                # Like Path.glob, a trailing "**" only matches directories
+                continue
+            # Every subdirectory, after zero directories
+            try:
+                with os.scandir(directory) as entries:
+                    subdirs = [
+                        entry.path for entry in entries
+                        if entry.is_dir(follow_symlinks=False) and entry.name not in _PRUNED_DIRS
+                    ]
+            except OSError:
+                subdirs = []
+            stack.extend((subdir, index) for subdir in reversed(subdirs))
+            stack.append((directory, index + 1))
+            continue
+
+        if index < last and not _GLOB_MAGIC_RE.search(part):
+            # Literal directory component: descend without listing
+            stack.append((os.path.join(directory, part), index + 1))
+            continue
+
+        matches = matchers[index]
+        try:
+            with os.scandir(directory) as entries:
+                hits = [entry for entry in entries if matches(entry.name)]
+        except OSError:
+            continue
+        if index < last:
+            subdirs = []
+            for entry in hits:
+                try:
+                    if entry.is_dir():
+                        subdirs.append(entry.path)
+                except OSError:
+                    continue
+            stack.extend((subdir, index + 1) for subdir in reversed(subdirs))
+            continue
+        for entry in hits:
+            try:
+                if entry.is_file() and entry.path not in seen:
+                    seen.add(entry.path)
+                    yield entry.path, entry.stat().st_mtime
+            except OSError:
+                continue
+
 
 class GlobTool(Tool):
     """Tool for finding files by pattern."""
@@ -48,15 +152,13 @@ class GlobTool(Tool):
                     error=f"Path not found: {path}",
                 )
 
-            # Find matching files
+            # Find matching files, newest first
             matches = sorted(
-                search_path.glob(pattern),
-                key=lambda p: p.stat().st_mtime,
+                _walk_glob(str(search_path), pattern),
+                key=itemgetter(1),
                 reverse=True,
             )
-
-            # Filter out directories, only return files
-            file_matches = [str(p) for p in matches if p.is_file()]
+            file_matches = [match_path for match_path, _ in matches]
 
             if not file_matches:
                 output = f"No files found matching pattern: {pattern}"
@@ -164,45 +266,41 @@ class GrepTool(Tool):
                 glob_pattern = glob or "**/*"
                 files = [f for f in search_path.glob(glob_pattern) if f.is_file()]
 
-            # Search files
+            # Search files in batches of concurrent worker threads; results
+            # are collected in file order, so output matches a serial scan
             results = []
             total_matches = 0
+            limit_reached = False
 
-            for file_path in files:
-                try:
-                    # Skip binary files
-                    if not self._is_text_file(file_path):
+            for start in range(0, len(files), _SCAN_BATCH_SIZE):
+                batch = files[start:start + _SCAN_BATCH_SIZE]
+                scanned = await asyncio.gather(
+                    *(asyncio.to_thread(self._scan_file, file_path, regex) for file_path in batch)
+                )
+
+                for file_path, file_matches in zip(batch, scanned):
+                    total_matches += len(file_matches)
+                    if not file_matches:
                         continue
 
-                    with open(file_path, "r", encoding="utf-8", errors="replace") as f:
-                        lines = f.readlines()
-
-                    # Find matches
-                    file_matches = []
-                    for i, line in enumerate(lines):
-                        if regex.search(line):
-                            file_matches.append((i + 1, line.rstrip()))
-                            total_matches += 1
-
-                    if file_matches:
-                        if output_mode == "files_with_matches":
-                            results.append(str(file_path))
-                        elif output_mode == "count":
-                            results.append(f"{file_path}: {len(file_matches)}")
-                        elif output_mode == "content":
-                            for line_num, line_content in file_matches:
-                                results.append(f"{file_path}:{line_num}: {line_content}")
-                                # Limit results to prevent huge outputs
-                                if len(results) >= 1000:
-                                    break
-
-                        # Break outer loop if we hit limit
-                        if len(results) >= 1000:
-                            break
-
-                except Exception:
-                    # Skip files that can't be read
-                    continue
+                    if output_mode == "files_with_matches":
+                        results.append(str(file_path))
+                    elif output_mode == "count":
+                        results.append(f"{file_path}: {len(file_matches)}")
+                    elif output_mode == "content":
+                        for line_num, line_content in file_matches:
+                            results.append(f"{file_path}:{line_num}: {line_content}")
+                            # Limit results to prevent huge outputs
+                            if len(results) >= 1000:
+                                break
+
+                    # Stop scanning once we hit the limit
+                    if len(results) >= 1000:
+                        limit_reached = True
+                        break
+
+                if limit_reached:
+                    break
 
             if not results:
                 output = f"No matches found for pattern: {pattern}"
@@ -229,6 +327,30 @@ class GrepTool(Tool):
                 error=f"Grep search failed: {str(e)}",
             )
 
+    @staticmethod
+    def _scan_file(file_path: Path, regex: re.Pattern) -> list[tuple[int, str]]:
+        """Find matching lines in one file.
+
+        Runs in a worker thread. Binary and unreadable files have no matches.
+
+        Returns:
+            List of (line number, line) for each matching line
+        """
+        try:
+            # Skip binary files
+            if not GrepTool._is_text_file(file_path):
+                return []
+
+            with open(file_path, "r", encoding="utf-8", errors="replace") as f:
+                return [
+                    (i, line.rstrip())
+                    for i, line in enumerate(f, 1)
+                    if regex.search(line)
+                ]
+        except Exception:
+            # Skip files that can't be read
+            return []
+
     @staticmethod
     def _is_text_file(path: Path) -> bool:
         """Check if a file is likely a text file."""
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""Test the BatchRead tool."""
+
+import asyncio
+import os
+import tempfile
+from athena.tools.file_ops import BatchReadTool
+
+async def test_batch_read_tool():
+    """Test BatchReadTool functionality."""
+    tool = BatchReadTool()
+
+    print("Testing BatchReadTool:\n")
+
+    # Create temporary files
+    test_files = []
+    for name in ("first", "second", "third"):
+        with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.txt') as f:
+            f.write(f"{name} line 1\n")
+            f.write(f"{name} line 2\n")
+            test_files.append(f.name)
+
+    try:
+        # Test 1: Results come back in the order given
+        print("Test 1: Read several files in order")
+        paths = [test_files[2], test_files[0], test_files[1]]
+        result = await tool.execute(file_paths=paths)
+        print(result.output)
+        assert result.success, f"Test 1 failed: {result.error}"
+        headers = [line for line in result.output.splitlines() if line.startswith("==> ")]
+        assert headers == [f"==> {p} <==" for p in paths], "Test 1: wrong order"
+        assert result.output.index("third line 1") < result.output.index("first line 1")
+        assert result.output.index("first line 1") < result.output.index("second line 1")
+        assert result.metadata["failed"] == []
+        print("-" * 60)
+
+        # Test 2: One missing file among good ones is reported inline
+        print("\nTest 2: One failing path among good ones")
+        missing = "/nonexistent/file.txt"
+        paths = [test_files[0], missing, test_files[1]]
+        result = await tool.execute(file_paths=paths)
+        print(result.output)
+        assert result.success, "Test 2: partial failure should still succeed"
+        assert result.metadata["failed"] == [missing]
+        assert f"==> {missing} <==\nError: File not found" in result.output
+        assert result.output.index("first line 1") < result.output.index(missing)
+        assert result.output.index(missing) < result.output.index("second line 1")
+        print("-" * 60)
+
+        # Test 3: All paths failing (should fail)
+        print("\nTest 3: All paths failing (should fail)")
+        result = await tool.execute(file_paths=[missing])
+        print(f"Result: {result.error}")
+        assert not result.success, "Test 3 should have failed"
+        print("-" * 60)
+
+        # Test 4: A single string instead of a list (should fail)
+        print("\nTest 4: String instead of list (should fail)")
+        result = await tool.execute(file_paths=test_files[0])
+        print(f"Result: {result.error}")
+        assert not result.success, "Test 4 should have failed"
+        assert "list" in result.error
+        print("✓ Correctly rejected non-list file_paths")
+        print("-" * 60)
+
+        print("\n" + "=" * 60)
+        print("✅ All tests passed!")
+        print("=" * 60)
+
+    finally:
+        # Cleanup
+        for test_file in test_files:
+            if os.path.exists(test_file):
+                os.unlink(test_file)
+
+if __name__ == "__main__":
+    asyncio.run(test_batch_read_tool())